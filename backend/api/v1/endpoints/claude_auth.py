@@ -28,7 +28,7 @@ class ApiKeyRequest(BaseModel):
 async def get_authentication_url() -> Dict[str, Any]:
     """Get Claude CLI authentication URL"""
     try:
-        result = claude_service.get_authentication_url()
+        result = await claude_service.get_authentication_url()
         
         if result["success"]:
             logger.log_system_event("auth_url_requested", {
@@ -73,7 +73,7 @@ async def get_authentication_status() -> Dict[str, Any]:
             }
         
         # This will trigger the authentication check
-        claude_service._check_claude_availability()
+        await claude_service._check_claude_availability()
         
         return {
             "success": True,
@@ -93,7 +93,7 @@ async def setup_api_key(request: ApiKeyRequest) -> Dict[str, Any]:
         os.environ['ANTHROPIC_API_KEY'] = request.api_key
         
         # Test the API key by checking Claude availability
-        claude_service._check_claude_availability()
+        await claude_service._check_claude_availability()
         
         logger.log_system_event("api_key_configured", {
             "message": "Claude CLI configured with API key"
@@ -56,10 +56,16 @@ class Settings(BaseSettings):
     MAX_AGENTS: int = 100
     AGENT_TIMEOUT: int = 300
     CLAUDE_CODE_TIMEOUT: int = 600  # 10 minutes for complex tasks
+    CLAUDE_OUTPUT_CAP: int = 1024 * 1024  # Max bytes of command output kept per stream (tail is kept)
     DEFAULT_CLAUDE_MODEL: str = "claude-4-sonnet"
     CLAUDE_HEADLESS_MODE: bool = True  # Run Claude CLI in headless mode
     PERSIST_CLAUDE_SESSIONS: bool = False  # Keep Claude sessions alive after backend shutdown
+    VERIFY_CLAUDE_VERSION: bool = False  # Run `claude --version` at startup instead of just checking the binary
     SAFE_RELOAD_MODE: bool = False  # Disable auto-reload to prevent Claude session conflicts
+    DOCKER_SOCKET_PATH: str = "/var/run/docker.sock"  # Docker Engine API socket for containerized sessions
+    DOCKER_POOL_SIZE: int = 4  # Prewarmed claude-dev containers kept ready for new agents
+    DOCKER_POOL_IDLE_TIMEOUT: int = 1800  # Seconds an unused pooled container lingers before removal
+    DOCKER_WORKSPACE_READ_ONLY: bool = False  # Mount the workspace read-only; agents write to /workspace/scratch
     
     # RAG Configuration
     VECTOR_DB_PATH: str = "./vector_db"
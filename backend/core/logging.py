@@ -3,12 +3,18 @@ ARTAC Logging Configuration
 Structured logging with multiple outputs
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any
 import structlog
 from core.config import settings
 
+# Background writer for log records, started once by setup_logging
+_queue_listener = None
+
 
 def setup_logging():
     """Configure structured logging for the application"""
@@ -33,12 +39,23 @@ def setup_logging():
         cache_logger_on_first_use=True,
     )
     
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
-    )
+    # Configure standard logging. Records are queued and written out by a
+    # listener thread, so logging from request handlers and background tasks
+    # never blocks the event loop on stdout
+    global _queue_listener
+    if _queue_listener is None:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        log_queue = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+        
+        logging.basicConfig(
+            format="%(message)s",
+            handlers=[QueueHandler(log_queue)],
+            level=getattr(logging, settings.LOG_LEVEL.upper()),
+        )
     
     # Set specific logger levels
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -54,6 +71,11 @@ class ARTACLogger:
     
     def __init__(self, name: str):
         self.logger = structlog.get_logger(name)
+        self._stdlib_logger = logging.getLogger(name)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a record at this level would be emitted"""
+        return self._stdlib_logger.isEnabledFor(level)
     
     def log_agent_action(self, agent_id: str, action: str, details: Dict[str, Any] = None):
         """Log agent actions with context"""
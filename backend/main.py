@@ -17,10 +17,16 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from core.config import settings
 from core.database import database
 from core.logging import setup_logging
 from api.v1.router import api_router
+from api.v1.endpoints.claude_auth import claude_service as auth_claude_service
 from services.agent_manager import AgentManager
 from services.rag_service import SmartRAGService
 from services.process_manager import process_manager
@@ -156,6 +162,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except asyncio.CancelledError:
             pass
     
+    # Stop background work in the Claude services
+    await agent_behavior_service.claude_service.shutdown()
+    await auth_claude_service.shutdown()
+    
     # Shutdown all Claude CLI processes (unless configured to persist)
     if not settings.PERSIST_CLAUDE_SESSIONS:
         await process_manager.shutdown_all_processes()
@@ -263,5 +273,7 @@ if __name__ == "__main__":
         port=8000,
         reload=reload_enabled,
         reload_excludes=['venv/**', '__pycache__/**', '*.pyc'] if reload_enabled else None,
-        log_level=settings.LOG_LEVEL.lower()
+        log_level=settings.LOG_LEVEL.lower(),
+        # uvloop speeds up the pipe-heavy Claude session I/O; unavailable on Windows
+        loop="uvloop" if uvloop and sys.platform != "win32" else "asyncio"
     )
\ No newline at end of file
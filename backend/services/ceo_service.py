@@ -4,18 +4,22 @@ Real CEO agent that makes decisions and hires agents
 """
 
 import asyncio
+import functools
+import re
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Final, FrozenSet, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from cachetools import TTLCache
+
 from core.logging import get_logger
 from services.agent_manager import AgentRole, AgentSkill
 from services.task_hierarchy_manager import TaskType, TaskPriority, task_hierarchy_manager
 from services.interaction_logger import interaction_logger, InteractionType
 from services.project_workspace_manager import project_workspace_manager
-from services.project_channel_manager import ProjectChannelManager
+from services.project_channel_manager import ProjectChannel, ProjectChannelManager
 from services.inter_agent_communication import InterAgentCommunicationService
 
 # Assembly platform integration
@@ -26,6 +30,9 @@ except ImportError:
     artac_assembly = None
     perpetual_efficiency_model = None
 
+_ASSEMBLY_ENABLED: Final[bool] = artac_assembly is not None
+_initiate_project_genesis = artac_assembly.initiate_project_genesis if _ASSEMBLY_ENABLED else None
+
 logger = get_logger(__name__)
 
 
@@ -36,6 +43,91 @@ class ProjectComplexity(Enum):
     ENTERPRISE = "enterprise"
 
 
+# Keyword tables for project analysis. Text is tokenized once per request and
+# matched against these sets; hyphenated terms survive tokenization intact.
+_TOKEN_PATTERN = re.compile(r"[\w-]+")
+
+_COMPLEXITY_KEYWORDS: Dict[ProjectComplexity, FrozenSet[str]] = {
+    ProjectComplexity.SIMPLE: frozenset({"simple", "basic", "calculator", "todo", "small"}),
+    ProjectComplexity.MODERATE: frozenset({"website", "api", "database", "user", "auth"}),
+    ProjectComplexity.COMPLEX: frozenset({"enterprise", "microservices", "cloud", "scale", "system"}),
+    ProjectComplexity.ENTERPRISE: frozenset({"distributed", "architecture", "scalable", "high-availability"})
+}
+
+# Tiers checked highest first when classifying a project
+_COMPLEXITY_ORDER: Tuple[ProjectComplexity, ...] = (
+    ProjectComplexity.ENTERPRISE,
+    ProjectComplexity.COMPLEX,
+    ProjectComplexity.MODERATE,
+    ProjectComplexity.SIMPLE
+)
+
+_SKILL_KEYWORDS: Dict[AgentSkill, FrozenSet[str]] = {
+    AgentSkill.BACKEND: frozenset({"api", "server", "database", "backend"}),
+    AgentSkill.FRONTEND: frozenset({"ui", "frontend", "react", "html", "css"}),
+    AgentSkill.FULLSTACK: frozenset({"fullstack", "full-stack", "website"}),
+    AgentSkill.TESTING: frozenset({"test", "quality", "qa", "testing"}),
+    AgentSkill.DEVOPS: frozenset({"deploy", "cloud", "docker", "infrastructure"}),
+    AgentSkill.DOCUMENTATION: frozenset({"docs", "documentation", "manual"})
+}
+
+# Multi-word phrases can't be matched as single tokens; keep substring checks
+_SKILL_PHRASES: Dict[AgentSkill, Tuple[str, ...]] = {
+    AgentSkill.FULLSTACK: ("web app",)
+}
+
+_NEXT_STEPS_TEMPLATES: Tuple[str, ...] = (
+    "✅ Assembled team of {n} specialists",
+    "🎯 Project scope: {c} complexity",
+    "⏱️ Estimated timeline: {h} hours",
+    "📋 Initial tasks assigned to team members",
+    "🚀 Development phase initiated"
+)
+
+_NEXT_STEPS_FOLLOW_UP: Tuple[str, ...] = (
+    "📊 Progress monitoring activated",
+    "🔄 Regular status updates will be provided",
+    "📧 Client will be notified of major milestones"
+)
+
+# Channel message templates
+_PROJECT_INITIATED_MSG = (
+    "🎯 **Project '{project_name}' has been initiated!**\n\n"
+    "I'll be assembling the perfect team for this project. "
+    "Stay tuned for updates as we bring the best agents on board."
+)
+
+_TEAM_ASSEMBLED_MSG = (
+    "📋 **Team Assembly Complete for '{title}'**\n\n"
+    "**Hired Agents:**\n{agent_list}\n\n"
+    "**Project Complexity:** {complexity}\n"
+    "**Estimated Timeline:** {team_size} agents × {hours_each} hours each\n\n"
+    "Let's build something amazing! 🚀"
+)
+
+_ASSIGN_MSG = (
+    "🤖 **Agent {name} assigned to project**\n\n"
+    "**Role:** {role}\n"
+    "**Status:** {status}\n"
+    "**Assignment:** Initial project analysis and task breakdown"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _next_steps_for(complexity: ProjectComplexity, team_size: int, hours: int) -> Tuple[str, ...]:
+    """Render the client-facing next steps for a project shape"""
+    steps = [
+        template.format(n=team_size, c=complexity.value, h=hours)
+        for template in _NEXT_STEPS_TEMPLATES
+    ]
+    
+    if complexity in (ProjectComplexity.COMPLEX, ProjectComplexity.ENTERPRISE):
+        steps.append("👥 Senior oversight assigned for quality assurance")
+    
+    steps.extend(_NEXT_STEPS_FOLLOW_UP)
+    return tuple(steps)
+
+
 @dataclass
 class Project:
     id: str
@@ -69,7 +161,8 @@ class CEOService:
         self.project_channel_manager = ProjectChannelManager(inter_agent_comm)
         self.active_projects: Dict[str, Project] = {}
         self.hiring_decisions: List[HiringDecision] = []
-        self.conversation_context: Dict[str, Any] = {}
+        # Per-user context expires after a day so long-running services don't grow unbounded
+        self.conversation_context: TTLCache = TTLCache(maxsize=10_000, ttl=24 * 3600)
         
         # CEO decision-making parameters
         self.max_budget_per_project = 50000
@@ -93,7 +186,8 @@ class CEOService:
         # CEO analyzes the project
         analysis = await self._analyze_project_requirements(title, description)
         
-        # Create project record
+        # Create project record; one clock read serves the whole request
+        now = datetime.utcnow()
         project = Project(
             id=project_id,
             title=title,
@@ -103,8 +197,8 @@ class CEOService:
             required_skills=analysis["required_skills"],
             assigned_agents=[],
             status="analyzing",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
         
         self.active_projects[project_id] = project
@@ -116,10 +210,10 @@ class CEOService:
         channels_created = await self._create_project_channels(project_id, title, "ceo-001")
         
         # Initialize Assembly platform for collaborative work
-        if artac_assembly:
+        if _ASSEMBLY_ENABLED:
             try:
                 # This integrates with the human directive workflow
-                await artac_assembly.initiate_project_genesis(
+                await _initiate_project_genesis(
                     human_directive=description,
                     project_title=title,
                     estimated_budget_hours=analysis["estimated_hours"],
@@ -136,6 +230,8 @@ class CEOService:
                     "project_id": project_id
                 })
         
+        skill_values = [skill.value for skill in analysis["required_skills"]]
+        
         # Log CEO decision-making process
         await interaction_logger.log_interaction(
             project_id=project_id,
@@ -147,7 +243,7 @@ class CEOService:
                 "user_id": user_id,
                 "complexity": analysis["complexity"].value,
                 "estimated_hours": analysis["estimated_hours"],
-                "required_skills": [skill.value for skill in analysis["required_skills"]]
+                "required_skills": skill_values
             }
         )
         
@@ -169,20 +265,22 @@ class CEOService:
         # Notify project channels about progress
         await self._notify_project_progress(project, hired_agents)
         
+        role_values = [role.value for role in hiring_decision.required_roles]
+        
         # Return CEO response
         response = {
             "project_id": project_id,
             "ceo_analysis": {
                 "complexity": analysis["complexity"].value,
                 "estimated_hours": analysis["estimated_hours"],
-                "required_skills": [skill.value for skill in analysis["required_skills"]],
+                "required_skills": skill_values,
                 "estimated_budget": hiring_decision.estimated_budget,
                 "timeline_days": hiring_decision.timeline_days
             },
             "hiring_decision": {
-                "roles_hired": [role.value for role in hiring_decision.required_roles],
+                "roles_hired": role_values,
                 "reasoning": hiring_decision.reasoning,
-                "team_size": len(hiring_decision.required_roles)
+                "team_size": len(role_values)
             },
             "hired_agents": [
                 {
@@ -201,7 +299,7 @@ class CEOService:
         self.conversation_context[user_id] = {
             "last_project_id": project_id,
             "last_interaction": "project_started",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
         
         return response
@@ -231,7 +329,7 @@ class CEOService:
             })
             return False
     
-    async def _create_project_channels(self, project_id: str, project_name: str, created_by: str) -> List[str]:
+    async def _create_project_channels(self, project_id: str, project_name: str, created_by: str) -> List[ProjectChannel]:
         """Create all project communication channels"""
         try:
             # Create structured channels for the project
@@ -254,7 +352,7 @@ class CEOService:
                     sender_id="ceo-001",
                     sender_name="ARTAC CEO",
                     sender_type="agent",
-                    content=f"🎯 **Project '{project_name}' has been initiated!**\n\nI'll be assembling the perfect team for this project. Stay tuned for updates as we bring the best agents on board.",
+                    content=_PROJECT_INITIATED_MSG.format(project_name=project_name),
                     message_type="announcement"
                 )
             
@@ -262,7 +360,7 @@ class CEOService:
                 "project_id": project_id,
                 "project_name": project_name,
                 "channels_created": len(channels),
-                "channel_types": [ch.split("_")[-2] for ch in channels]  # Extract channel types
+                "channel_types": [channel.channel_type.value for channel in channels]
             })
             
             return channels
@@ -286,14 +384,21 @@ class CEOService:
             
             if announcements_channel:
                 # Create hiring announcement
-                agent_list = "\n".join([f"• **{agent.name}** ({agent.role.value})" for agent in hired_agents])
+                agent_list = "\n".join(f"• **{agent.name}** ({agent.role.value})" for agent in hired_agents)
+                team_size = len(hired_agents)
                 
                 await self.project_channel_manager.send_channel_message(
                     channel_id=announcements_channel.id,
                     sender_id="ceo-001",
                     sender_name="ARTAC CEO",
                     sender_type="agent",
-                    content=f"📋 **Team Assembly Complete for '{project.title}'**\n\n**Hired Agents:**\n{agent_list}\n\n**Project Complexity:** {project.complexity.value.title()}\n**Estimated Timeline:** {len(hired_agents)} agents × {project.estimated_hours // len(hired_agents)} hours each\n\nLet's build something amazing! 🚀",
+                    content=_TEAM_ASSEMBLED_MSG.format(
+                        title=project.title,
+                        agent_list=agent_list,
+                        complexity=project.complexity.value.title(),
+                        team_size=team_size,
+                        hours_each=project.estimated_hours // team_size
+                    ),
                     message_type="announcement"
                 )
             
@@ -310,7 +415,11 @@ class CEOService:
                         sender_id="ceo-001",
                         sender_name="ARTAC CEO",
                         sender_type="agent",
-                        content=f"🤖 **Agent {agent.name} assigned to project**\n\n**Role:** {agent.role.value}\n**Status:** {agent.status.value}\n**Assignment:** Initial project analysis and task breakdown",
+                        content=_ASSIGN_MSG.format(
+                            name=agent.name,
+                            role=agent.role.value,
+                            status=agent.status.value
+                        ),
                         message_type="agent_assignment",
                         metadata={
                             "agent_id": agent.id,
@@ -330,45 +439,30 @@ class CEOService:
         
         # Simple keyword-based analysis (could be enhanced with LLM)
         text = (title + " " + description).lower()
+        tokens = frozenset(_TOKEN_PATTERN.findall(text))
         
         # Determine complexity
-        complexity_indicators = {
-            ProjectComplexity.SIMPLE: ["simple", "basic", "calculator", "todo", "small"],
-            ProjectComplexity.MODERATE: ["website", "api", "database", "user", "auth"],
-            ProjectComplexity.COMPLEX: ["enterprise", "microservices", "cloud", "scale", "system"],
-            ProjectComplexity.ENTERPRISE: ["distributed", "architecture", "scalable", "high-availability"]
-        }
-        
+        # The highest tier with any keyword hit wins
         complexity = ProjectComplexity.SIMPLE
-        max_score = 0
-        
-        for comp, keywords in complexity_indicators.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > max_score:
-                max_score = score
+        for comp in _COMPLEXITY_ORDER:
+            if not tokens.isdisjoint(_COMPLEXITY_KEYWORDS[comp]):
                 complexity = comp
+                break
         
         # Determine required skills
-        skill_keywords = {
-            AgentSkill.BACKEND: ["api", "server", "database", "backend"],
-            AgentSkill.FRONTEND: ["ui", "frontend", "react", "html", "css"],
-            AgentSkill.FULLSTACK: ["fullstack", "full-stack", "web app", "website"],
-            AgentSkill.TESTING: ["test", "quality", "qa", "testing"],
-            AgentSkill.DEVOPS: ["deploy", "cloud", "docker", "infrastructure"],
-            AgentSkill.DOCUMENTATION: ["docs", "documentation", "manual"]
-        }
-        
-        required_skills = []
-        for skill, keywords in skill_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                required_skills.append(skill)
+        required_skills: Dict[AgentSkill, None] = {}
+        for skill, keywords in _SKILL_KEYWORDS.items():
+            if not tokens.isdisjoint(keywords) or any(
+                phrase in text for phrase in _SKILL_PHRASES.get(skill, ())
+            ):
+                required_skills.setdefault(skill, None)
         
         # Default skills for common projects
         if not required_skills:
-            if "calculator" in text or "simple" in text:
-                required_skills = [AgentSkill.BACKEND, AgentSkill.TESTING]
+            if "calculator" in tokens or "simple" in tokens:
+                required_skills = dict.fromkeys((AgentSkill.BACKEND, AgentSkill.TESTING))
             else:
-                required_skills = [AgentSkill.FULLSTACK, AgentSkill.TESTING]
+                required_skills = dict.fromkeys((AgentSkill.FULLSTACK, AgentSkill.TESTING))
         
         # Estimate hours based on complexity
         hour_estimates = {
@@ -380,7 +474,7 @@ class CEOService:
         
         return {
             "complexity": complexity,
-            "required_skills": required_skills,
+            "required_skills": list(required_skills),
             "estimated_hours": hour_estimates[complexity]
         }
     
@@ -397,24 +491,22 @@ class CEOService:
             AgentSkill.DOCUMENTATION: AgentRole.DEVELOPER
         }
         
-        required_roles = []
+        # Insertion-ordered dict used as an ordered set
+        required_roles: Dict[AgentRole, None] = {}
         for skill in project.required_skills:
-            role = role_mapping.get(skill, AgentRole.DEVELOPER)
-            if role not in required_roles:
-                required_roles.append(role)
+            required_roles.setdefault(role_mapping.get(skill, AgentRole.DEVELOPER), None)
         
         # Add senior oversight for complex projects
         if project.complexity in [ProjectComplexity.COMPLEX, ProjectComplexity.ENTERPRISE]:
-            if AgentRole.SENIOR_DEVELOPER not in required_roles:
-                required_roles.append(AgentRole.SENIOR_DEVELOPER)
+            required_roles.setdefault(AgentRole.SENIOR_DEVELOPER, None)
         
         # Ensure minimum team size
         min_size = self.preferred_team_sizes[project.complexity]
         while len(required_roles) < min_size:
             if AgentRole.DEVELOPER not in required_roles:
-                required_roles.append(AgentRole.DEVELOPER)
+                required_roles[AgentRole.DEVELOPER] = None
             elif AgentRole.QA_ENGINEER not in required_roles:
-                required_roles.append(AgentRole.QA_ENGINEER)
+                required_roles[AgentRole.QA_ENGINEER] = None
             else:
                 break
         
@@ -427,18 +519,17 @@ class CEOService:
             AgentRole.ARCHITECT: 150
         }
         
-        estimated_budget = sum(
-            role_costs.get(role, 80) * (project.estimated_hours / len(required_roles))
-            for role in required_roles
-        )
+        team_size = len(required_roles)
+        hours_per_role = project.estimated_hours / team_size
+        estimated_budget = hours_per_role * sum(role_costs.get(role, 80) for role in required_roles)
         
-        timeline_days = max(5, project.estimated_hours // (len(required_roles) * 8))
+        timeline_days = max(5, project.estimated_hours // (team_size * 8))
         
         # CEO reasoning
         reasoning = f"""
         Project Analysis: {project.complexity.value.title()} project requiring {project.estimated_hours} hours.
         
-        Team Strategy: Assembling {len(required_roles)} specialists with complementary skills.
+        Team Strategy: Assembling {team_size} specialists with complementary skills.
         
         Roles: {', '.join(role.value.replace('_', ' ').title() for role in required_roles)}
         
@@ -448,11 +539,11 @@ class CEOService:
         
         return HiringDecision(
             project_id=project.id,
-            required_roles=required_roles,
+            required_roles=list(required_roles),
             reasoning=reasoning,
             estimated_budget=estimated_budget,
             timeline_days=timeline_days,
-            created_at=datetime.utcnow()
+            created_at=project.created_at
         )
     
     async def _execute_hiring_plan(self, project: Project, hiring_decision: HiringDecision) -> List:
@@ -570,25 +661,7 @@ class CEOService:
     
     def _generate_next_steps(self, project: Project, hired_agents: List) -> List[str]:
         """Generate next steps for the project"""
-        
-        steps = [
-            f"✅ Assembled team of {len(hired_agents)} specialists",
-            f"🎯 Project scope: {project.complexity.value} complexity",
-            f"⏱️ Estimated timeline: {project.estimated_hours} hours",
-            "📋 Initial tasks assigned to team members",
-            "🚀 Development phase initiated"
-        ]
-        
-        if project.complexity in [ProjectComplexity.COMPLEX, ProjectComplexity.ENTERPRISE]:
-            steps.append("👥 Senior oversight assigned for quality assurance")
-        
-        steps.extend([
-            "📊 Progress monitoring activated",
-            "🔄 Regular status updates will be provided",
-            "📧 Client will be notified of major milestones"
-        ])
-        
-        return steps
+        return list(_next_steps_for(project.complexity, len(hired_agents), project.estimated_hours))
     
     async def get_project_status(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get current status of a project"""
@@ -7,77 +7,152 @@ import asyncio
 import json
 import logging
 import os
+import shlex
 import tempfile
-import uuid
+import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import subprocess
+from typing import Deque, Dict, List, Optional, Any, Tuple
 import sys
 
+import httpx
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 from core.config import settings
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+CLAUDE_DEV_IMAGE = "artac-claude-dev:latest"
+ARTAC_NETWORK = "artac-network"
+# Claude CLI version baked into the image; images labelled otherwise are rebuilt
+CLAUDE_CLI_VERSION = "latest"
+CLAUDE_VERSION_LABEL = "io.artac.claude_version"
+# Marks Docker setup as done across processes for the image configuration and
+# the image id it was done against
+SETUP_STAMP_PATH = Path(tempfile.gettempdir()) / "artac-docker-setup.stamp"
+SETUP_STAMP_KEY = f"{CLAUDE_DEV_IMAGE}:{CLAUDE_CLI_VERSION}:{ARTAC_NETWORK}"
+# Query for listing agent containers, serialized once; the daemon filters and
+# returns one decoded JSON array rather than a line per container
+CONTAINER_LIST_PARAMS = {"all": "true", "filters": json.dumps({"name": ["claude-agent-"]})}
+# Host directory mounted as the agent workspace, resolved once at import
+WORKSPACE_HOST = os.path.abspath(os.getcwd())
+# Container create body; identical for every session
+CONTAINER_CONFIG = {
+    "Image": CLAUDE_DEV_IMAGE,
+    # Keep container running
+    "Cmd": ["tail", "-f", "/dev/null"],
+    # Agent identity is passed per command so pooled containers can be reused
+    "Env": [
+        "ENVIRONMENT=development",
+        "DEBUG=true",
+        "ARTAC_SCRATCH=/workspace/scratch"
+    ],
+    "HostConfig": {
+        # Mount the workspace; read-only mounts skip host write contention between agents
+        "Binds": [
+            f"{WORKSPACE_HOST}:/workspace/artac:ro"
+            if settings.DOCKER_WORKSPACE_READ_ONLY
+            else f"{WORKSPACE_HOST}:/workspace/artac"
+        ],
+        # Per-container writable scratch space
+        "Tmpfs": {"/workspace/scratch": "rw,size=512m"},
+        "NetworkMode": ARTAC_NETWORK
+    }
+}
+# Bytes requested per read from the in-container shell; output is read in
+# chunks rather than lines so no single line can overflow a buffer
+SHELL_READ_CHUNK = 65536
+# Placeholder owner for prewarmed containers not yet handed to an agent
+POOL_AGENT_ID = "pool"
+# Run in a released container before pooling it: kills everything but PID 1 and
+# empties the scratch tmpfs so the next agent starts clean
+CONTAINER_RESET_SCRIPT = "kill -KILL -1 2>/dev/null; find /workspace/scratch -mindepth 1 -delete"
+
+
+def create_docker_client() -> httpx.AsyncClient:
+    """Create a keep-alive client for the Docker Engine API on the local socket"""
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(uds=settings.DOCKER_SOCKET_PATH),
+        base_url="http://docker",
+        timeout=30.0
+    )
+
+
+async def _run(*cmd: str, capture_output: bool = True, **kwargs) -> Tuple[int, bytes, bytes]:
+    """Run a command without blocking the event loop; returns (returncode, stdout, stderr)
+
+    With capture_output=False output goes to /dev/null and no pipes are created.
+    """
+    stream = asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL
+    process = await asyncio.create_subprocess_exec(*cmd, stdout=stream, stderr=stream, **kwargs)
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout or b"", stderr or b""
+
 
 class DockerClaudeCodeSession:
     """Manages a Claude Code session inside a Docker container"""
     
-    def __init__(self, agent_id: str, container_name: str = None):
+    def __init__(self, agent_id: str, docker: httpx.AsyncClient, container_name: str = None):
         self.agent_id = agent_id
-        self.session_id = str(uuid.uuid4())
+        self.docker = docker
+        self.session_id = os.urandom(8).hex()
         self.container_name = container_name or f"claude-agent-{agent_id}-{self.session_id[:8]}"
         self.container_id: Optional[str] = None
         self.is_active = False
         
+        # Long-lived shell inside the container; commands are framed by a sentinel line
+        self._shell: Optional[asyncio.subprocess.Process] = None
+        self._shell_pid: Optional[int] = None
+        self._shell_lock = asyncio.Lock()
+        self._sentinel = f"__ARTAC_DONE_{self.session_id[:8]}__".encode()
+        
         logger.log_agent_action(
             agent_id=self.agent_id,
             action="docker_session_created",
             details={"session_id": self.session_id, "container_name": self.container_name}
         )
     
+    def assign(self, agent_id: str):
+        """Hand a pooled, already-running container to an agent"""
+        self.agent_id = agent_id
+        
+        logger.log_agent_action(
+            agent_id=self.agent_id,
+            action="docker_session_assigned",
+            details={"session_id": self.session_id, "container_name": self.container_name}
+        )
+    
     async def start_session(self) -> bool:
         """Start a Claude Code session in a Docker container"""
         try:
-            # Build the docker run command
-            docker_cmd = [
-                "docker", "run", "-d",
-                "--name", self.container_name,
-                "--network", "artac-network",
-                # Mount the workspace
-                "-v", f"{os.path.abspath('.')}:/workspace/artac",
-                # Environment variables
-                "-e", f"AGENT_ID={self.agent_id}",
-                "-e", f"SESSION_ID={self.session_id}",
-                "-e", "ENVIRONMENT=development",
-                "-e", "DEBUG=true",
-                # Use the claude-dev image
-                "artac-claude-dev:latest",
-                # Keep container running
-                "tail", "-f", "/dev/null"
-            ]
-            
-            # Start the container
-            result = subprocess.run(docker_cmd, capture_output=True, text=True)
+            # Create the container through the Engine API
+            response = await self.docker.post(
+                "/containers/create",
+                params={"name": self.container_name},
+                json=CONTAINER_CONFIG
+            )
             
-            if result.returncode != 0:
-                logger.error(f"Failed to start Docker container: {result.stderr}")
+            if response.status_code != 201:
+                logger.error(f"Failed to create Docker container: {response.text}")
                 return False
             
-            self.container_id = result.stdout.strip()
-            
-            # Install Claude Code in the container
-            install_cmd = [
-                "docker", "exec", self.container_name,
-                "bash", "-c", 
-                "curl -fsSL https://storage.googleapis.com/public-scripts/install-claude-cli.sh | bash"
-            ]
+            self.container_id = response.json()["Id"]
             
-            install_result = subprocess.run(install_cmd, capture_output=True, text=True)
+            # Start the container
+            response = await self.docker.post(f"/containers/{self.container_id}/start")
             
-            if install_result.returncode != 0:
-                logger.warning(f"Claude Code installation failed: {install_result.stderr}")
-                # Continue anyway - Claude might already be installed
+            if response.status_code not in (204, 304):
+                logger.error(f"Failed to start Docker container: {response.text}")
+                await self.docker.delete(f"/containers/{self.container_id}", params={"force": "true"})
+                self.container_id = None
+                return False
             
             self.is_active = True
             
@@ -97,61 +172,179 @@ class DockerClaudeCodeSession:
             logger.log_error(e, {"agent_id": self.agent_id, "action": "start_docker_session"})
             return False
     
+    async def _ensure_shell(self) -> asyncio.subprocess.Process:
+        """Attach a persistent bash to the container, restarting it if it exited"""
+        if self._shell is None or self._shell.returncode is not None:
+            # setsid makes the shell a process group leader so a hung command
+            # tree can be killed as a unit; -w keeps setsid waiting if it had to
+            # fork, so docker exec tracks the shell rather than an exited parent
+            self._shell = await asyncio.create_subprocess_exec(
+                "docker", "exec", "-i", self.container_name, "setsid", "-w", "bash",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            # Field 5 of /proc/<pid>/stat is the process group id
+            self._shell.stdin.write(b"echo $$ $(cut -d' ' -f5 /proc/$$/stat)\n")
+            await self._shell.stdin.drain()
+            pid, pgid = (int(field) for field in (await self._shell.stdout.readline()).split())
+            if pid != pgid:
+                # kill -- -pid would miss the command tree, or hit another group
+                await self._kill_shell()
+                raise RuntimeError("Container shell is not a process group leader")
+            self._shell_pid = pid
+        return self._shell
+    
+    async def _read_until_sentinel(self, stream: asyncio.StreamReader) -> Tuple[bytes, bytes, bool]:
+        """Read a framed response; returns (output tail, sentinel line, truncated)"""
+        cap = settings.CLAUDE_OUTPUT_CAP
+        # The sentinel is printed after a newline of its own, which isn't output
+        marker = b"\n" + self._sentinel
+        buffer = bytearray()
+        scan_from = 0
+        truncated = False
+        while True:
+            chunk = await stream.read(SHELL_READ_CHUNK)
+            if not chunk:
+                raise RuntimeError("Container shell exited unexpectedly")
+            buffer.extend(chunk)
+            
+            start = buffer.find(marker, scan_from)
+            if start != -1:
+                end = buffer.find(b"\n", start + len(marker))
+                if end != -1:
+                    break
+                # The rest of the sentinel line is still to come
+                scan_from = start
+                continue
+            
+            # A marker split across chunks starts within its length of the end
+            scan_from = max(0, len(buffer) - len(marker) + 1)
+            excess = len(buffer) - cap - len(marker)
+            if excess > 0:
+                # Keep only the tail so memory stays bounded on huge outputs
+                del buffer[:excess]
+                scan_from = max(0, scan_from - excess)
+                truncated = True
+        
+        output = buffer[:start]
+        if len(output) > cap:
+            del output[:-cap]
+            truncated = True
+        if truncated:
+            # The cut can land inside a multi-byte UTF-8 character; start the
+            # tail at the next character instead
+            lead = 0
+            while lead < min(3, len(output)) and output[lead] & 0xC0 == 0x80:
+                lead += 1
+            del output[:lead]
+        return bytes(output), bytes(buffer[start + 1:end + 1]), truncated
+    
+    async def _kill_shell(self):
+        """Kill the persistent shell and anything it started; the next command starts a fresh one"""
+        shell, pid = self._shell, self._shell_pid
+        self._shell = None
+        self._shell_pid = None
+        
+        if shell is None:
+            return
+        
+        if shell.returncode is None:
+            shell.kill()
+            try:
+                await asyncio.wait_for(shell.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                pass
+        
+        # Killing the local docker exec client leaves the in-container tree running
+        if pid is not None:
+            try:
+                await _run(
+                    "docker", "exec", self.container_name, "kill", "-KILL", "--", f"-{pid}",
+                    capture_output=False
+                )
+            except Exception as e:
+                logger.log_error(e, {"agent_id": self.agent_id, "action": "kill_container_shell"})
+    
+    async def reset(self) -> bool:
+        """Clear out the previous agent's processes and scratch files; False if the container can't be reused"""
+        await self._kill_shell()
+        try:
+            returncode, _, _ = await _run(
+                "docker", "exec", self.container_name, "sh", "-c", CONTAINER_RESET_SCRIPT,
+                capture_output=False
+            )
+        except Exception as e:
+            logger.log_error(e, {"agent_id": self.agent_id, "action": "reset_docker_session"})
+            return False
+        return returncode == 0
+    
     async def execute_command(self, command: str, timeout: int = None) -> Dict[str, Any]:
         """Execute a command in the Docker container"""
         if not self.is_active or not self.container_id:
             raise RuntimeError("Docker session not active")
         
         timeout = timeout or settings.CLAUDE_CODE_TIMEOUT
+        sentinel = self._sentinel.decode()
         
-        try:
-            # Execute command in container
-            docker_exec_cmd = [
-                "docker", "exec", "-i", self.container_name,
-                "bash", "-c", f"cd /workspace/artac && {command}"
-            ]
-            
-            process = await asyncio.create_subprocess_exec(
-                *docker_exec_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
+        # Subshell keeps env/cd/exit from leaking into the persistent shell; stdin
+        # is detached so the command can't swallow the next framed request
+        env = f"export AGENT_ID={shlex.quote(self.agent_id)} SESSION_ID={shlex.quote(self.session_id)}"
+        script = (
+            f"( {env}; cd /workspace/artac && {command}\n) < /dev/null; "
+            f"printf '\\n{sentinel}%s\\n' $?; printf '\\n{sentinel}\\n' >&2\n"
+        )
+        
+        async with self._shell_lock:
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
-                )
+                shell = await self._ensure_shell()
+                shell.stdin.write(script.encode())
+                await shell.stdin.drain()
                 
-                return {
-                    "success": process.returncode == 0,
-                    "stdout": stdout.decode() if stdout else "",
-                    "stderr": stderr.decode() if stderr else "",
-                    "return_code": process.returncode,
-                    "command": command,
-                    "container": self.container_name
-                }
-                
-            except asyncio.TimeoutError:
-                process.terminate()
+                try:
+                    (stdout, marker, stdout_truncated), (stderr, _, stderr_truncated) = await asyncio.wait_for(
+                        asyncio.gather(
+                            self._read_until_sentinel(shell.stdout),
+                            self._read_until_sentinel(shell.stderr)
+                        ),
+                        timeout=timeout
+                    )
+                    
+                    return_code = int(marker[len(self._sentinel):].strip() or 1)
+                    
+                    return {
+                        "success": return_code == 0,
+                        "stdout": stdout.decode(errors="replace"),
+                        "stderr": stderr.decode(errors="replace"),
+                        "return_code": return_code,
+                        "stdout_truncated": stdout_truncated,
+                        "stderr_truncated": stderr_truncated,
+                        "command": command,
+                        "container": self.container_name
+                    }
+                    
+                except asyncio.TimeoutError:
+                    # The shell is mid-command; its framing can't be trusted anymore
+                    await self._kill_shell()
+                    return {
+                        "success": False,
+                        "error": "Command timed out",
+                        "timeout": timeout,
+                        "command": command
+                    }
+                    
+            except Exception as e:
+                await self._kill_shell()
+                logger.log_error(e, {
+                    "agent_id": self.agent_id,
+                    "command": command[:100],
+                    "action": "execute_docker_command"
+                })
                 return {
                     "success": False,
-                    "error": "Command timed out",
-                    "timeout": timeout,
+                    "error": str(e),
                     "command": command
                 }
-                
-        except Exception as e:
-            logger.log_error(e, {
-                "agent_id": self.agent_id,
-                "command": command[:100],
-                "action": "execute_docker_command"
-            })
-            return {
-                "success": False,
-                "error": str(e),
-                "command": command
-            }
     
     async def execute_claude_command(self, claude_command: str, timeout: int = None) -> Dict[str, Any]:
         """Execute a Claude Code command in the Docker container"""
@@ -161,12 +354,13 @@ class DockerClaudeCodeSession:
     
     async def close_session(self, remove_container: bool = True):
         """Close the Docker session"""
+        await self._kill_shell()
+        
         if self.container_id:
             try:
                 if remove_container:
-                    # Stop and remove container
-                    subprocess.run(["docker", "stop", self.container_name], capture_output=True)
-                    subprocess.run(["docker", "rm", self.container_name], capture_output=True)
+                    # Force-remove stops and removes the container in one call
+                    await self.docker.delete(f"/containers/{self.container_id}", params={"force": "true"})
                     
                     logger.log_agent_action(
                         agent_id=self.agent_id,
@@ -175,7 +369,7 @@ class DockerClaudeCodeSession:
                     )
                 else:
                     # Just stop the container, keep it for debugging
-                    subprocess.run(["docker", "stop", self.container_name], capture_output=True)
+                    await self.docker.post(f"/containers/{self.container_id}/stop")
                     
                     logger.log_agent_action(
                         agent_id=self.agent_id,
@@ -196,63 +390,213 @@ class ClaudeCodeDockerService:
     
     def __init__(self):
         self.active_sessions: Dict[str, DockerClaudeCodeSession] = {}
-        self._ensure_docker_setup()
+        self._docker = create_docker_client()
+        self._docker_ready = False
+        self._setup_lock = asyncio.Lock()
+        self._image_ready = asyncio.Event()
+        self._image_error: Optional[Exception] = None
+        self._build_task: Optional[asyncio.Task] = None
+        self._pending_sessions: Dict[str, asyncio.Future] = {}
+        # Bound concurrent container creates so dockerd isn't swamped on bursts
+        self._create_sem = asyncio.Semaphore(min(os.cpu_count() or 4, 8))
+        
+        # Warm pool of running containers waiting for an agent, with release times
+        self._idle_pool: Deque[Tuple[DockerClaudeCodeSession, float]] = deque()
+        self._pool_target = settings.DOCKER_POOL_SIZE
+        self._pool_idle_timeout = settings.DOCKER_POOL_IDLE_TIMEOUT
+        self._pool_tasks: List[asyncio.Task] = []
+        self._refill_task: Optional[asyncio.Task] = None
     
-    def _ensure_docker_setup(self):
-        """Ensure Docker is available and claude-dev image is built"""
+    async def initialize(self):
+        """Probe Docker ahead of the first session; a needed image build continues in the background"""
+        await self._ensure_ready()
+    
+    async def _probe_docker(self) -> Optional[str]:
+        """Check the daemon is up; returns the claude-dev image id if it has the expected Claude CLI baked in"""
         try:
             # Check if Docker is available
-            result = subprocess.run(["docker", "version"], capture_output=True)
-            if result.returncode != 0:
+            response = await self._docker.get("/version")
+            if response.status_code != 200:
                 raise RuntimeError("Docker is not available")
             
-            # Check if claude-dev image exists
-            result = subprocess.run(
-                ["docker", "images", "-q", "artac-claude-dev:latest"],
-                capture_output=True,
-                text=True
-            )
-            
-            if not result.stdout.strip():
-                logger.info("Building claude-dev Docker image...")
-                # Build the image
-                build_result = subprocess.run(
-                    ["docker", "build", "-t", "artac-claude-dev:latest", "./claude-dev"],
-                    cwd=os.path.dirname(os.path.dirname(__file__)),
-                    capture_output=True,
-                    text=True
-                )
-                
-                if build_result.returncode != 0:
-                    raise RuntimeError(f"Failed to build Docker image: {build_result.stderr}")
-                
-                logger.info("Claude-dev Docker image built successfully")
+            response = await self._docker.get(f"/images/{CLAUDE_DEV_IMAGE}/json")
+        except Exception as e:
+            logger.log_error(e, {"action": "probe_docker"})
+            raise RuntimeError(f"Docker setup failed: {e}")
+        
+        if response.status_code != 200:
+            return None
+        image = response.json()
+        labels = image.get("Config", {}).get("Labels") or {}
+        return image["Id"] if labels.get(CLAUDE_VERSION_LABEL) == CLAUDE_CLI_VERSION else None
+    
+    async def _ensure_docker_setup(self, image_id: Optional[str]):
+        """Finish Docker setup for a probed image id; builds a missing claude-dev image in the background"""
+        try:
+            if image_id is None:
+                # Builds can take minutes; sessions wait on _image_ready instead
+                self._image_ready.clear()
+                self._build_task = asyncio.create_task(self._build_image())
+            else:
+                self._mark_image_ready(image_id)
             
-            # Ensure network exists
-            subprocess.run(
-                ["docker", "network", "create", "artac-network"],
-                capture_output=True
-            )
+            # Ensure network exists; 409 means it already does
+            await self._docker.post("/networks/create", json={"Name": ARTAC_NETWORK})
             
             logger.log_system_event("docker_claude_ready", {
-                "image": "artac-claude-dev:latest",
-                "network": "artac-network"
+                "image": CLAUDE_DEV_IMAGE,
+                "network": ARTAC_NETWORK,
+                "image_building": not self._image_ready.is_set()
             })
             
         except Exception as e:
             logger.log_error(e, {"action": "ensure_docker_setup"})
             raise RuntimeError(f"Docker setup failed: {e}")
     
+    async def _build_image(self):
+        """Build the claude-dev image and release sessions waiting on it"""
+        try:
+            logger.info("Building claude-dev Docker image...")
+            returncode, _, stderr = await _run(
+                "docker", "build", "-t", CLAUDE_DEV_IMAGE,
+                "--build-arg", f"CLAUDE_CODE_VERSION={CLAUDE_CLI_VERSION}",
+                "./claude-dev",
+                cwd=os.path.dirname(os.path.dirname(__file__))
+            )
+            
+            if returncode != 0:
+                raise RuntimeError(f"Failed to build Docker image: {stderr.decode(errors='replace')}")
+            
+            response = await self._docker.get(f"/images/{CLAUDE_DEV_IMAGE}/json")
+            response.raise_for_status()
+            self._mark_image_ready(response.json()["Id"])
+            
+            logger.info("Claude-dev Docker image built successfully")
+            
+        except Exception as e:
+            logger.log_error(e, {"action": "build_claude_dev_image"})
+            self._image_error = e
+            self._docker_ready = False
+            self._image_ready.set()
+    
+    def _mark_image_ready(self, image_id: str):
+        """Record the usable image for this and other processes"""
+        self._image_error = None
+        SETUP_STAMP_PATH.write_text(json.dumps({
+            "setup_key": SETUP_STAMP_KEY,
+            "image_id": image_id
+        }))
+        self._image_ready.set()
+    
+    async def _wait_for_image(self):
+        """Block until the claude-dev image is available"""
+        await self._image_ready.wait()
+        if self._image_error is not None:
+            raise RuntimeError(f"Docker setup failed: {self._image_error}")
+    
+    async def _ensure_ready(self):
+        """Run Docker setup once, skipping steps another process already did
+        
+        The daemon and image are always probed, since either may have been
+        restarted or rebuilt since the stamp was written.
+        """
+        if self._docker_ready:
+            return
+        
+        async with self._setup_lock:
+            if self._docker_ready:
+                return
+            
+            image_id = await self._probe_docker()
+            if image_id is not None and self._has_setup_stamp(image_id):
+                self._image_error = None
+                self._image_ready.set()
+            else:
+                await self._ensure_docker_setup(image_id)
+            
+            self._docker_ready = True
+            if not self._pool_tasks:
+                self._pool_tasks = [asyncio.create_task(self._reap_idle())]
+                self._schedule_refill()
+    
+    def _has_setup_stamp(self, image_id: str) -> bool:
+        """Check whether setup already ran for the current image configuration and image"""
+        try:
+            stamp = json.loads(SETUP_STAMP_PATH.read_text())
+        except (OSError, ValueError):
+            return False
+        return stamp.get("setup_key") == SETUP_STAMP_KEY and stamp.get("image_id") == image_id
+    
+    def _invalidate_setup(self):
+        """Forget cached setup so the next session re-probes Docker"""
+        self._docker_ready = False
+        self._image_ready.clear()
+        SETUP_STAMP_PATH.unlink(missing_ok=True)
+    
     async def get_or_create_session(self, agent_id: str) -> DockerClaudeCodeSession:
         """Get existing session or create new one for agent"""
-        if agent_id not in self.active_sessions:
-            session = DockerClaudeCodeSession(agent_id)
-            if await session.start_session():
-                self.active_sessions[agent_id] = session
-            else:
+        session = self.active_sessions.get(agent_id)
+        if session is not None:
+            return session
+        
+        # Concurrent callers for the same agent share one in-flight creation
+        pending = self._pending_sessions.get(agent_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._create_session(agent_id))
+            self._pending_sessions[agent_id] = pending
+            pending.add_done_callback(lambda _: self._pending_sessions.pop(agent_id, None))
+        
+        # Shielded so one caller's cancellation doesn't abort the others' wait
+        return await asyncio.shield(pending)
+    
+    async def _create_session(self, agent_id: str) -> DockerClaudeCodeSession:
+        """Check out a pooled container or start a new one for the agent"""
+        await self._ensure_ready()
+        await self._wait_for_image()
+        
+        if self._idle_pool:
+            # Most recently released first so stale containers age out
+            session, _ = self._idle_pool.pop()
+            session.assign(agent_id)
+            self._schedule_refill()
+        else:
+            session = DockerClaudeCodeSession(agent_id, self._docker)
+            async with self._create_sem:
+                started = await session.start_session()
+            if not started:
+                # Image or network may have gone away since setup was cached
+                self._invalidate_setup()
                 raise RuntimeError(f"Failed to start Docker session for agent {agent_id}")
         
-        return self.active_sessions[agent_id]
+        self.active_sessions[agent_id] = session
+        return session
+    
+    def _schedule_refill(self):
+        """Top the idle pool back up in the background, one refill at a time"""
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._prewarm_pool())
+    
+    async def _prewarm_pool(self):
+        """Start containers until the idle pool reaches its target size"""
+        await self._wait_for_image()
+        
+        while len(self._idle_pool) < self._pool_target:
+            session = DockerClaudeCodeSession(POOL_AGENT_ID, self._docker)
+            async with self._create_sem:
+                started = await session.start_session()
+            if not started:
+                break
+            self._idle_pool.append((session, time.monotonic()))
+    
+    async def _reap_idle(self):
+        """Remove pooled containers that have lingered past the idle timeout"""
+        while True:
+            await asyncio.sleep(60)
+            
+            cutoff = time.monotonic() - self._pool_idle_timeout
+            while self._idle_pool and self._idle_pool[0][1] < cutoff:
+                session, _ = self._idle_pool.popleft()
+                await session.close_session()
     
     async def execute_for_agent(
         self, 
@@ -271,9 +615,17 @@ class ClaudeCodeDockerService:
     
     async def close_agent_session(self, agent_id: str, keep_container: bool = False):
         """Close session for specific agent"""
-        if agent_id in self.active_sessions:
-            await self.active_sessions[agent_id].close_session(remove_container=not keep_container)
-            del self.active_sessions[agent_id]
+        session = self.active_sessions.pop(agent_id, None)
+        if session is None:
+            return
+        
+        if (not keep_container and session.is_active and len(self._idle_pool) < self._pool_target
+                and await session.reset() and len(self._idle_pool) < self._pool_target):
+            # Let the container linger for the next agent instead of tearing it down
+            session.assign(POOL_AGENT_ID)
+            self._idle_pool.append((session, time.monotonic()))
+        else:
+            await session.close_session(remove_container=not keep_container)
     
     async def close_all_sessions(self, keep_containers: bool = False):
         """Close all active Docker sessions"""
@@ -282,15 +634,34 @@ class ClaudeCodeDockerService:
             "keep_containers": keep_containers
         })
         
-        for agent_id in list(self.active_sessions.keys()):
-            await self.close_agent_session(agent_id, keep_container=keep_containers)
+        sessions = list(self.active_sessions.values())
+        self.active_sessions.clear()
+        pooled = [session for session, _ in self._idle_pool]
+        self._idle_pool.clear()
+        
+        # Containers are independent, so tear them down concurrently
+        await asyncio.gather(
+            *(session.close_session(remove_container=not keep_containers) for session in sessions),
+            *(session.close_session() for session in pooled)
+        )
     
     def get_session_status(self, agent_id: str) -> Dict[str, Any]:
         """Get status of agent's Docker session"""
-        if agent_id not in self.active_sessions:
+        session = self.active_sessions.get(agent_id)
+        if session is None:
             return {"active": False}
         
-        session = self.active_sessions[agent_id]
+        return self._session_status(session)
+    
+    def get_all_sessions_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of all active Docker sessions"""
+        return {
+            agent_id: self._session_status(session)
+            for agent_id, session in self.active_sessions.items()
+        }
+    
+    @staticmethod
+    def _session_status(session: DockerClaudeCodeSession) -> Dict[str, Any]:
         return {
             "active": session.is_active,
             "session_id": session.session_id,
@@ -298,38 +669,38 @@ class ClaudeCodeDockerService:
             "container_id": session.container_id
         }
     
-    def get_all_sessions_status(self) -> Dict[str, Dict[str, Any]]:
-        """Get status of all active Docker sessions"""
-        return {
-            agent_id: self.get_session_status(agent_id)
-            for agent_id in self.active_sessions
-        }
-    
     async def list_docker_containers(self) -> List[Dict[str, str]]:
         """List all Claude-related Docker containers"""
         try:
-            result = subprocess.run(
-                ["docker", "ps", "-a", "--filter", "name=claude-agent-", "--format", "json"],
-                capture_output=True,
-                text=True
-            )
-            
-            containers = []
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    container_info = json.loads(line)
-                    containers.append({
-                        "id": container_info.get("ID"),
-                        "name": container_info.get("Names"),
-                        "status": container_info.get("Status"),
-                        "created": container_info.get("CreatedAt")
-                    })
+            response = await self._docker.get("/containers/json", params=CONTAINER_LIST_PARAMS)
+            response.raise_for_status()
             
-            return containers
+            return [
+                {
+                    "id": container_info.get("Id"),
+                    "name": ",".join(name.lstrip("/") for name in container_info.get("Names", [])),
+                    "status": container_info.get("Status"),
+                    "created": datetime.utcfromtimestamp(container_info.get("Created", 0)).isoformat()
+                }
+                for container_info in json_loads(response.content)
+            ]
             
         except Exception as e:
             logger.log_error(e, {"action": "list_docker_containers"})
             return []
+    
+    async def shutdown(self):
+        """Cleanup resources"""
+        for task in self._pool_tasks:
+            task.cancel()
+        self._pool_tasks = []
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+        if self._build_task is not None:
+            self._build_task.cancel()
+        
+        await self.close_all_sessions()
+        await self._docker.aclose()
 
 
 # Global Docker service instance
@@ -4,22 +4,63 @@ Enables realistic multi-agent consensus building, voting, and collaborative proj
 """
 
 import asyncio
-import uuid
+import functools
+import heapq
+import itertools
+import secrets
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterable, Awaitable, Mapping, Callable
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import json
 
+import numpy as np
+from cachetools import TTLCache
+
 from core.logging import get_logger
 from services.inter_agent_communication import InterAgentCommunicationService
 from services.project_channel_manager import ProjectChannelManager, ChannelType
-from services.organizational_hierarchy import organizational_hierarchy
+from services.organizational_hierarchy import org_hierarchy
 from services.agent_behavior import agent_behavior_service
 from models.organizational_hierarchy import Agent, AuthorityLevel
 
 logger = get_logger(__name__)
 
+# How long before a decision's deadline discussion closes and voting opens
+VOTING_LEAD_TIME = timedelta(minutes=30)
+_VOTING_LEAD_SECONDS = VOTING_LEAD_TIME.total_seconds()
+# Share of required participants who must vote before consensus is judged
+MIN_PARTICIPATION = 0.8
+# Consensus thresholds at or above this are treated as requiring unanimity
+UNANIMITY_THRESHOLD = 0.999
+# Lifecycle phases run by the deadline scheduler
+_PHASE_VOTING = "voting"
+_PHASE_EVALUATE = "evaluate"
+# Ids only need to be unique within this process: a random per-process prefix
+# plus a counter, instead of drawing a uuid4 for every id
+_PROC_PREFIX = secrets.token_hex(3)
+_id_counter = itertools.count()
+
+
+def _new_id(kind: str) -> str:
+    """Generate a process-unique id such as decision_3fa9c10
+    
+    Ids are interned: they key the decision, option and vote indexes and are
+    compared often, and interned strings compare by identity first.
+    """
+    return sys.intern(f"{kind}_{_PROC_PREFIX}{next(_id_counter):x}")
+
+
+# Agent names and roles don't change over a decision, so lookups are reused briefly
+AGENT_INFO_CACHE_SIZE = 4096
+AGENT_INFO_TTL_SECONDS = 60
+# Authority weights change only on reorgs, so they're reused across decisions for a while
+AUTHORITY_WEIGHT_TTL_SECONDS = 300
+DEFAULT_AUTHORITY_WEIGHT = 1.0
+
 
 class DecisionType(str, Enum):
     PROJECT_APPROACH = "project_approach"
@@ -41,10 +82,15 @@ class DecisionStatus(str, Enum):
     CONSENSUS_REACHED = "consensus_reached"
     APPROVED = "approved"
     REJECTED = "rejected"
+    CONFLICT_RESOLUTION = "conflict_resolution"
     IMPLEMENTATION = "implementation"
     COMPLETED = "completed"
 
 
+# Statuses in which a decision still accepts votes
+_OPEN_STATUSES = frozenset({DecisionStatus.DISCUSSING, DecisionStatus.VOTING})
+
+
 class VoteType(str, Enum):
     APPROVE = "approve"
     REJECT = "reject"
@@ -52,7 +98,233 @@ class VoteType(str, Enum):
     CONDITIONAL = "conditional"  # Approve with conditions
 
 
-@dataclass
+# int8 codes for the vote matrix; _NO_VOTE marks cells an agent hasn't voted in
+_VOTE_CODES = {
+    VoteType.ABSTAIN: 0,
+    VoteType.APPROVE: 1,
+    VoteType.REJECT: 2,
+    VoteType.CONDITIONAL: 3,
+}
+_APPROVE_CODE = _VOTE_CODES[VoteType.APPROVE]
+_NO_VOTE = -1
+
+# Display names precomputed once rather than re-formatted for every message
+_DECISION_TYPE_DISPLAY = {dt: dt.value.replace('_', ' ').title() for dt in DecisionType}
+_LEVEL_TITLE = {"low": "Low", "medium": "Medium", "high": "High"}
+
+
+def _level_title(level: str) -> str:
+    """Title-case an effort or risk level"""
+    return _LEVEL_TITLE.get(level) or level.title()
+
+
+@functools.lru_cache(maxsize=256)
+def _deadline_display(deadline: datetime) -> str:
+    """Format a deadline for messages; each decision's deadline is formatted once"""
+    return deadline.strftime('%Y-%m-%d %H:%M')
+
+
+_DISCUSSION_TEMPLATE = """🎯 **COLLABORATIVE DECISION REQUIRED**
+
+**Decision:** {title}
+**Type:** {decision_type}
+**Facilitator:** {facilitator_name}
+**Deadline:** {deadline}
+
+**Context:**
+{description}
+
+**Options to Consider:**
+{options_summary}
+
+**Participants:**
+{participant_mentions}
+
+**Next Steps:**
+1. 💭 **Discussion Phase**: Share your thoughts, concerns, and suggestions
+2. 🗳️ **Voting Phase**: Cast your votes with reasoning
+3. ✅ **Consensus Building**: Work toward agreement
+4. 📋 **Implementation**: Execute the decided approach
+
+**Discussion Guidelines:**
+• Consider all technical, business, and timeline implications
+• Share your expertise and concerns openly
+• Ask clarifying questions
+• Propose alternative solutions if needed
+
+Let's start the discussion! What are your initial thoughts on these options?"""
+
+# Final reasoning recorded on a decision; {reasons} is one "• reason" line per
+# distinct reason and {timeline} an optional trailing Timeline Impact line
+_REASONING_TEMPLATE = (
+    "**Decision:** {title}\n"
+    "**Consensus Level:** {pct} ({ratio:.2f} ratio)\n"
+    "**Primary Reasons:**\n"
+    "{reasons}"
+    "**Implementation Effort:** {effort}\n"
+    "**Risk Level:** {risk}\n"
+    "**Key Benefits:** {benefits}"
+    "{timeline}"
+)
+
+
+# Default option templates per decision type; DecisionOptions are stamped from these
+_BASE_OPTIONS_PROJECT_APPROACH = (
+    {
+        "title": "Agile/Scrum with 2-week Sprints",
+        "description": "Iterative development with regular sprint cycles, daily standups, and sprint reviews",
+        "pros": ("Flexible to changes", "Regular feedback cycles", "Team collaboration"),
+        "cons": ("Requires experienced team", "Can be overhead for small projects"),
+        "implementation_effort": "medium",
+        "risk_level": "low"
+    },
+    {
+        "title": "Kanban Continuous Flow",
+        "description": "Continuous delivery with work-in-progress limits and visual workflow management",
+        "pros": ("Continuous delivery", "Visual workflow", "Flexible priorities"),
+        "cons": ("Less structured", "Requires mature team"),
+        "implementation_effort": "low",
+        "risk_level": "medium"
+    },
+    {
+        "title": "Hybrid Agile-Waterfall",
+        "description": "Combine planning phases with iterative development cycles",
+        "pros": ("Structured planning", "Iterative delivery", "Risk mitigation"),
+        "cons": ("More complex", "Potential overhead"),
+        "implementation_effort": "high",
+        "risk_level": "medium"
+    }
+)
+_BASE_OPTIONS_TECH_BY_PROJECT_TYPE = {
+    "web_application": (
+        {
+            "title": "React + Node.js + PostgreSQL",
+            "description": "Modern JavaScript stack with React frontend, Node.js backend, and PostgreSQL database",
+            "pros": ("Unified language", "Large ecosystem", "Good performance"),
+            "cons": ("JavaScript complexity", "Rapid ecosystem changes"),
+            "implementation_effort": "medium",
+            "risk_level": "low"
+        },
+        {
+            "title": "Python + Django + PostgreSQL",
+            "description": "Python web framework with batteries included and robust database",
+            "pros": ("Rapid development", "Mature framework", "Great libraries"),
+            "cons": ("Performance limitations", "GIL constraints"),
+            "implementation_effort": "low",
+            "risk_level": "low"
+        },
+        {
+            "title": "Java + Spring Boot + MySQL",
+            "description": "Enterprise-grade Java framework with proven scalability",
+            "pros": ("Enterprise proven", "Strong typing", "Great tooling"),
+            "cons": ("Verbose code", "Slower development"),
+            "implementation_effort": "high",
+            "risk_level": "low"
+        }
+    )
+}
+_BASE_OPTIONS_TECH_CUSTOM = (
+    {"title": "Custom Analysis Required", "description": "Project type requires specific technology analysis", "pros": (), "cons": (), "implementation_effort": "medium", "risk_level": "medium"},
+)
+_BASE_OPTIONS_GENERIC = (
+    {
+        "title": "Option A - Conservative Approach",
+        "description": "Lower risk option with proven methods",
+        "pros": ("Lower risk", "Proven approach"),
+        "cons": ("May be slower", "Less innovative"),
+        "implementation_effort": "low",
+        "risk_level": "low"
+    },
+    {
+        "title": "Option B - Balanced Approach", 
+        "description": "Moderate risk with good potential upside",
+        "pros": ("Good balance", "Reasonable timeline"),
+        "cons": ("Some uncertainty", "Moderate complexity"),
+        "implementation_effort": "medium",
+        "risk_level": "medium"
+    },
+    {
+        "title": "Option C - Innovative Approach",
+        "description": "Higher risk but potentially higher reward option",
+        "pros": ("Cutting edge", "High potential value"),
+        "cons": ("Higher risk", "Unknown challenges"),
+        "implementation_effort": "high", 
+        "risk_level": "high"
+    }
+)
+
+
+# Decision templates and facilitator preferences are fixed, so they're built once
+# and shared read-only; role names are stored lowercased to match role lookups
+_DECISION_TEMPLATES: Mapping[DecisionType, Mapping[str, Any]] = MappingProxyType({
+    DecisionType.PROJECT_APPROACH: MappingProxyType({
+        "minimum_consensus": 0.75,
+        "authority_required": AuthorityLevel.MIDDLE_MANAGEMENT,
+        "typical_participants": ("cto", "senior_developer", "architect"),
+        "discussion_duration": timedelta(hours=2),
+        "common_options": (
+            "Agile/Scrum approach with 2-week sprints",
+            "Kanban continuous flow approach",
+            "Waterfall with defined phases",
+            "Hybrid approach combining methodologies"
+        )
+    }),
+    DecisionType.ARCHITECTURE_DECISION: MappingProxyType({
+        "minimum_consensus": 0.8,
+        "authority_required": AuthorityLevel.SENIOR_MANAGEMENT,
+        "typical_participants": ("cto", "architect", "senior_developer"),
+        "discussion_duration": timedelta(hours=3),
+        "common_options": (
+            "Microservices architecture",
+            "Monolithic architecture",
+            "Serverless architecture",
+            "Hybrid architecture"
+        )
+    }),
+    DecisionType.TECHNOLOGY_STACK: MappingProxyType({
+        "minimum_consensus": 0.7,
+        "authority_required": AuthorityLevel.MIDDLE_MANAGEMENT,
+        "typical_participants": ("cto", "senior_developer", "developer", "devops"),
+        "discussion_duration": timedelta(hours=1.5),
+        "common_options": ()  # Will be generated based on project context
+    }),
+    DecisionType.TIMELINE_ESTIMATION: MappingProxyType({
+        "minimum_consensus": 0.6,
+        "authority_required": AuthorityLevel.MIDDLE_MANAGEMENT,
+        "typical_participants": ("project_manager", "senior_developer", "developer", "qa"),
+        "discussion_duration": timedelta(hours=1),
+        "common_options": ()  # Will be generated based on project scope
+    })
+})
+
+# Preference order for facilitators by decision type
+_FACILITATOR_PREFERENCES: Mapping[DecisionType, Tuple[str, ...]] = MappingProxyType({
+    DecisionType.PROJECT_APPROACH: ("project_manager", "cto", "senior_developer"),
+    DecisionType.ARCHITECTURE_DECISION: ("architect", "cto", "senior_developer"),
+    DecisionType.TECHNOLOGY_STACK: ("cto", "architect", "senior_developer"),
+    DecisionType.TIMELINE_ESTIMATION: ("project_manager", "senior_developer"),
+    DecisionType.RESOURCE_ALLOCATION: ("cto", "project_manager"),
+    DecisionType.BUDGET_APPROVAL: ("ceo", "cto")
+})
+_DEFAULT_FACILITATOR_ROLES = ("senior_developer", "cto")
+
+# Mock project team and agent directory until the agent management system is wired in
+_PROJECT_AGENTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "cto-001": MappingProxyType({"role": "CTO", "name": "Technical Director"}),
+    "dev-001": MappingProxyType({"role": "Senior Developer", "name": "Lead Developer"}),
+    "dev-002": MappingProxyType({"role": "Developer", "name": "Backend Developer"}),
+    "qa-001": MappingProxyType({"role": "QA Engineer", "name": "Quality Assurance"})
+})
+_AGENT_MAPPING: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "cto-001": MappingProxyType({"name": "Technical Director", "role": "CTO"}),
+    "dev-001": MappingProxyType({"name": "Lead Developer", "role": "Senior Developer"}),
+    "dev-002": MappingProxyType({"name": "Backend Developer", "role": "Developer"}),
+    "qa-001": MappingProxyType({"name": "Quality Assurance", "role": "QA Engineer"}),
+    "system": MappingProxyType({"name": "System", "role": "System"})
+})
+
+
+@dataclass(slots=True)
 class DecisionOption:
     """Represents an option in a decision"""
     id: str
@@ -69,7 +341,7 @@ class DecisionOption:
     vote_reasoning: Dict[str, str]  # agent_id -> reasoning
 
 
-@dataclass
+@dataclass(slots=True)
 class CollaborativeDecision:
     """Represents a collaborative decision process"""
     id: str
@@ -94,9 +366,25 @@ class CollaborativeDecision:
     selected_option: Optional[str]  # option_id
     final_reasoning: Optional[str]
     metadata: Dict[str, Any]
+    # Optional participants are reached through the channel @mention; DM them only when set
+    notify_optional_privately: bool = False
+    # time.monotonic() reading at the deadline; scheduling uses this, deadline is for display.
+    # Whatever moves deadline must move this with it
+    deadline_monotonic: float = field(default=0.0, repr=False)
+    option_columns: Dict[str, int] = field(default_factory=dict, repr=False)  # option_id -> index in options
+    # voters x options matrix of _VOTE_CODES, mirrored from option votes for tallying;
+    # voter-major so each ballot is one contiguous row
+    vote_matrix: Optional[np.ndarray] = field(default=None, repr=False)
+    voter_rows: Dict[str, int] = field(default_factory=dict, repr=False)  # agent_id -> row
+    authority_weights: Optional[np.ndarray] = field(default=None, repr=False)  # float32 weight per row
+    # Running tallies kept current as votes are recorded, so evaluation doesn't rescan the matrix
+    approval_weights: Optional[np.ndarray] = field(default=None, repr=False)  # weighted approvals per option
+    cast_weight: float = 0.0
+    eligible_weight: float = 0.0  # authority weight of everyone with a vote row
+    total_votes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanningSession:
     """Represents a collaborative planning session"""
     id: str
@@ -130,53 +418,19 @@ class CollaborativeDecisionSystem:
         self.project_channel_manager = project_channel_manager
         self.active_decisions: Dict[str, CollaborativeDecision] = {}
         self.planning_sessions: Dict[str, PlanningSession] = {}
-        self.decision_templates: Dict[DecisionType, Dict[str, Any]] = {}
-        
-        # Initialize decision templates
-        self._initialize_decision_templates()
-    
-    def _initialize_decision_templates(self):
-        """Initialize templates for different types of decisions"""
-        self.decision_templates = {
-            DecisionType.PROJECT_APPROACH: {
-                "minimum_consensus": 0.75,
-                "authority_required": AuthorityLevel.MIDDLE_MANAGEMENT,
-                "typical_participants": ["cto", "senior_developer", "architect"],
-                "discussion_duration": timedelta(hours=2),
-                "common_options": [
-                    "Agile/Scrum approach with 2-week sprints",
-                    "Kanban continuous flow approach", 
-                    "Waterfall with defined phases",
-                    "Hybrid approach combining methodologies"
-                ]
-            },
-            DecisionType.ARCHITECTURE_DECISION: {
-                "minimum_consensus": 0.8,
-                "authority_required": AuthorityLevel.SENIOR_MANAGEMENT,
-                "typical_participants": ["cto", "architect", "senior_developer"],
-                "discussion_duration": timedelta(hours=3),
-                "common_options": [
-                    "Microservices architecture",
-                    "Monolithic architecture",
-                    "Serverless architecture",
-                    "Hybrid architecture"
-                ]
-            },
-            DecisionType.TECHNOLOGY_STACK: {
-                "minimum_consensus": 0.7,
-                "authority_required": AuthorityLevel.MIDDLE_MANAGEMENT,
-                "typical_participants": ["cto", "senior_developer", "developer", "devops"],
-                "discussion_duration": timedelta(hours=1.5),
-                "common_options": []  # Will be generated based on project context
-            },
-            DecisionType.TIMELINE_ESTIMATION: {
-                "minimum_consensus": 0.6,
-                "authority_required": AuthorityLevel.MIDDLE_MANAGEMENT,
-                "typical_participants": ["project_manager", "senior_developer", "developer", "qa"],
-                "discussion_duration": timedelta(hours=1),
-                "common_options": []  # Will be generated based on project scope
-            }
-        }
+        self.decision_templates: Mapping[DecisionType, Mapping[str, Any]] = _DECISION_TEMPLATES
+        # Pending lifecycle transitions as (loop time, phase, decision_id), run by one scheduler task
+        self._deadline_heap: List[Tuple[float, str, str]] = []
+        self._scheduler_wakeup = asyncio.Event()
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._phase_tasks: Set[asyncio.Task] = set()
+        self._project_agents_by_role: Dict[str, Dict[str, List[str]]] = {}  # project_id -> role -> agent_ids
+        self._agent_info_cache: TTLCache = TTLCache(maxsize=AGENT_INFO_CACHE_SIZE, ttl=AGENT_INFO_TTL_SECONDS)
+        # Lookups in flight, so concurrent callers share one backend request
+        self._inflight_lookups: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._authority_weight_cache: TTLCache = TTLCache(
+            maxsize=AGENT_INFO_CACHE_SIZE, ttl=AUTHORITY_WEIGHT_TTL_SECONDS
+        )
     
     async def initiate_collaborative_decision(
         self,
@@ -187,11 +441,12 @@ class CollaborativeDecisionSystem:
         initiated_by: str,
         context: Dict[str, Any] = None,
         custom_options: List[Dict[str, Any]] = None,
-        deadline: Optional[datetime] = None
+        deadline: Optional[datetime] = None,
+        notify_optional_privately: bool = False
     ) -> str:
         """Initiate a collaborative decision-making process"""
         try:
-            decision_id = f"decision_{uuid.uuid4().hex[:8]}"
+            decision_id = _new_id("decision")
             template = self.decision_templates.get(decision_type, {})
             
             # Determine participants based on decision type and project context
@@ -203,7 +458,7 @@ class CollaborativeDecisionSystem:
             if custom_options:
                 options = [
                     DecisionOption(
-                        id=f"opt_{uuid.uuid4().hex[:6]}",
+                        id=_new_id("opt"),
                         title=opt["title"],
                         description=opt["description"],
                         proposed_by=opt.get("proposed_by", initiated_by),
@@ -221,6 +476,13 @@ class CollaborativeDecisionSystem:
             else:
                 options = await self._generate_default_options(decision_type, context or {})
             
+            # Participants keep fixed vote rows, weighted once by authority for every tally
+            participant_ids = participants["required"] + participants["optional"]
+            weights = self._get_authority_weights(participant_ids)
+            
+            now = datetime.utcnow()
+            deadline = deadline or (now + template.get("discussion_duration", timedelta(hours=2)))
+            
             # Create decision
             decision = CollaborativeDecision(
                 id=decision_id,
@@ -235,16 +497,23 @@ class CollaborativeDecisionSystem:
                 minimum_consensus=template.get("minimum_consensus", 0.7),
                 authority_required=template.get("authority_required", AuthorityLevel.MIDDLE_MANAGEMENT),
                 initiated_by=initiated_by,
-                facilitator=await self._select_facilitator(participants["required"], decision_type),
+                facilitator=await self._select_facilitator(
+                    project_id, participants["required"], decision_type
+                ),
                 status=DecisionStatus.PROPOSED,
                 discussion_messages=[],
-                deadline=deadline or (datetime.utcnow() + template.get("discussion_duration", timedelta(hours=2))),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                deadline=deadline,
+                created_at=now,
+                updated_at=now,
                 decision_made_at=None,
                 selected_option=None,
                 final_reasoning=None,
-                metadata={}
+                metadata={},
+                notify_optional_privately=notify_optional_privately,
+                deadline_monotonic=time.monotonic() + (deadline - now).total_seconds(),
+                voter_rows={agent_id: i for i, agent_id in enumerate(participant_ids)},
+                authority_weights=np.array([weights[agent_id] for agent_id in participant_ids], dtype=np.float32),
+                eligible_weight=sum(weights.values())
             )
             
             self.active_decisions[decision_id] = decision
@@ -253,13 +522,13 @@ class CollaborativeDecisionSystem:
             await self._initiate_decision_discussion(decision)
             
             # Schedule automated follow-ups
-            asyncio.create_task(self._manage_decision_lifecycle(decision_id))
+            self._schedule(decision_id, _PHASE_VOTING, decision.deadline_monotonic - _VOTING_LEAD_SECONDS)
             
             logger.log_system_event("collaborative_decision_initiated", {
                 "decision_id": decision_id,
                 "project_id": project_id,
                 "decision_type": decision_type.value,
-                "participants": len(participants["required"] + participants["optional"]),
+                "participants": len(participant_ids),
                 "options": len(options)
             })
             
@@ -281,41 +550,34 @@ class CollaborativeDecisionSystem:
     ) -> Dict[str, List[str]]:
         """Determine who should participate in the decision"""
         try:
-            # Get project team members
-            project_agents = await self._get_project_agents(project_id)
+            # Get project team members, indexed by role
+            agents_by_role = await self._get_project_agents_by_role(project_id)
             template = self.decision_templates.get(decision_type, {})
             
-            required_participants = []
-            optional_participants = []
+            required_participants: Set[str] = set()
+            optional_participants: Set[str] = set()
             
             # Add typical participants based on decision type
-            typical_roles = template.get("typical_participants", [])
+            typical_roles = template.get("typical_participants", ())
             for role in typical_roles:
-                agents_with_role = [
-                    agent_id for agent_id, agent_info in project_agents.items()
-                    if agent_info.get("role", "").lower() == role.lower()
-                ]
-                required_participants.extend(agents_with_role)
+                required_participants.update(agents_by_role.get(role, ()))
             
             # Always include the initiator
-            if initiated_by not in required_participants:
-                required_participants.append(initiated_by)
+            required_participants.add(initiated_by)
             
             # Add authority figures if needed
             authority_required = template.get("authority_required", AuthorityLevel.MIDDLE_MANAGEMENT)
-            authority_agents = await organizational_hierarchy.get_agents_with_authority(authority_required)
-            for agent in authority_agents:
-                if agent.id not in required_participants:
-                    optional_participants.append(agent.id)
+            authority_agents = await org_hierarchy.get_agents_with_authority(authority_required)
+            optional_participants.update(agent.id for agent in authority_agents)
             
             # Add other project team members as optional
-            for agent_id in project_agents:
-                if agent_id not in required_participants and agent_id not in optional_participants:
-                    optional_participants.append(agent_id)
+            for role_agents in agents_by_role.values():
+                optional_participants.update(role_agents)
             
+            # Keep the two lists disjoint so callers can concatenate them
             return {
-                "required": list(set(required_participants)),
-                "optional": list(set(optional_participants))
+                "required": list(required_participants),
+                "optional": list(optional_participants - required_participants)
             }
             
         except Exception as e:
@@ -332,138 +594,71 @@ class CollaborativeDecisionSystem:
         context: Dict[str, Any]
     ) -> List[DecisionOption]:
         """Generate default options for a decision type"""
-        options = []
-        
         if decision_type == DecisionType.PROJECT_APPROACH:
-            base_options = [
-                {
-                    "title": "Agile/Scrum with 2-week Sprints",
-                    "description": "Iterative development with regular sprint cycles, daily standups, and sprint reviews",
-                    "pros": ["Flexible to changes", "Regular feedback cycles", "Team collaboration"],
-                    "cons": ["Requires experienced team", "Can be overhead for small projects"],
-                    "implementation_effort": "medium",
-                    "risk_level": "low"
-                },
-                {
-                    "title": "Kanban Continuous Flow",
-                    "description": "Continuous delivery with work-in-progress limits and visual workflow management",
-                    "pros": ["Continuous delivery", "Visual workflow", "Flexible priorities"],
-                    "cons": ["Less structured", "Requires mature team"],
-                    "implementation_effort": "low",
-                    "risk_level": "medium"
-                },
-                {
-                    "title": "Hybrid Agile-Waterfall",
-                    "description": "Combine planning phases with iterative development cycles",
-                    "pros": ["Structured planning", "Iterative delivery", "Risk mitigation"],
-                    "cons": ["More complex", "Potential overhead"],
-                    "implementation_effort": "high",
-                    "risk_level": "medium"
-                }
-            ]
+            base_options = _BASE_OPTIONS_PROJECT_APPROACH
         elif decision_type == DecisionType.TECHNOLOGY_STACK:
             # Generate options based on project context
             project_type = context.get("project_type", "web_application")
-            if project_type == "web_application":
-                base_options = [
-                    {
-                        "title": "React + Node.js + PostgreSQL",
-                        "description": "Modern JavaScript stack with React frontend, Node.js backend, and PostgreSQL database",
-                        "pros": ["Unified language", "Large ecosystem", "Good performance"],
-                        "cons": ["JavaScript complexity", "Rapid ecosystem changes"],
-                        "implementation_effort": "medium",
-                        "risk_level": "low"
-                    },
-                    {
-                        "title": "Python + Django + PostgreSQL",
-                        "description": "Python web framework with batteries included and robust database",
-                        "pros": ["Rapid development", "Mature framework", "Great libraries"],
-                        "cons": ["Performance limitations", "GIL constraints"],
-                        "implementation_effort": "low",
-                        "risk_level": "low"
-                    },
-                    {
-                        "title": "Java + Spring Boot + MySQL",
-                        "description": "Enterprise-grade Java framework with proven scalability",
-                        "pros": ["Enterprise proven", "Strong typing", "Great tooling"],
-                        "cons": ["Verbose code", "Slower development"],
-                        "implementation_effort": "high",
-                        "risk_level": "low"
-                    }
-                ]
-            else:
-                base_options = [{"title": "Custom Analysis Required", "description": "Project type requires specific technology analysis", "pros": [], "cons": [], "implementation_effort": "medium", "risk_level": "medium"}]
+            base_options = _BASE_OPTIONS_TECH_BY_PROJECT_TYPE.get(project_type, _BASE_OPTIONS_TECH_CUSTOM)
         else:
             # Default generic options
-            base_options = [
-                {
-                    "title": "Option A - Conservative Approach",
-                    "description": "Lower risk option with proven methods",
-                    "pros": ["Lower risk", "Proven approach"],
-                    "cons": ["May be slower", "Less innovative"],
-                    "implementation_effort": "low",
-                    "risk_level": "low"
-                },
-                {
-                    "title": "Option B - Balanced Approach", 
-                    "description": "Moderate risk with good potential upside",
-                    "pros": ["Good balance", "Reasonable timeline"],
-                    "cons": ["Some uncertainty", "Moderate complexity"],
-                    "implementation_effort": "medium",
-                    "risk_level": "medium"
-                },
-                {
-                    "title": "Option C - Innovative Approach",
-                    "description": "Higher risk but potentially higher reward option",
-                    "pros": ["Cutting edge", "High potential value"],
-                    "cons": ["Higher risk", "Unknown challenges"],
-                    "implementation_effort": "high", 
-                    "risk_level": "high"
-                }
-            ]
+            base_options = _BASE_OPTIONS_GENERIC
         
-        # Convert to DecisionOption objects
-        for i, opt in enumerate(base_options):
-            options.append(DecisionOption(
-                id=f"opt_{uuid.uuid4().hex[:6]}",
+        # Stamp fresh DecisionOption objects; only ids and vote fields are per-decision
+        return [
+            DecisionOption(
+                id=_new_id("opt"),
                 title=opt["title"],
                 description=opt["description"],
                 proposed_by="system",
-                pros=opt.get("pros", []),
-                cons=opt.get("cons", []),
-                implementation_effort=opt.get("implementation_effort", "medium"),
-                risk_level=opt.get("risk_level", "medium"),
+                pros=list(opt["pros"]),
+                cons=list(opt["cons"]),
+                implementation_effort=opt["implementation_effort"],
+                risk_level=opt["risk_level"],
                 cost_estimate=opt.get("cost_estimate"),
                 timeline_impact=opt.get("timeline_impact"),
                 votes={},
                 vote_reasoning={}
-            ))
-        
-        return options
+            )
+            for opt in base_options
+        ]
     
     async def _select_facilitator(
         self, 
+        project_id: str,
         required_participants: List[str], 
         decision_type: DecisionType
     ) -> Optional[str]:
         """Select the best facilitator for the decision"""
         try:
-            # Preference order for facilitators by decision type
-            facilitator_preferences = {
-                DecisionType.PROJECT_APPROACH: ["project_manager", "cto", "senior_developer"],
-                DecisionType.ARCHITECTURE_DECISION: ["architect", "cto", "senior_developer"],
-                DecisionType.TECHNOLOGY_STACK: ["cto", "architect", "senior_developer"],
-                DecisionType.TIMELINE_ESTIMATION: ["project_manager", "senior_developer"],
-                DecisionType.RESOURCE_ALLOCATION: ["cto", "project_manager"],
-                DecisionType.BUDGET_APPROVAL: ["ceo", "cto"]
-            }
+            preferred_roles = _FACILITATOR_PREFERENCES.get(decision_type, _DEFAULT_FACILITATOR_ROLES)
+            
+            # Roles come from the project's role index; only participants outside
+            # the project roster, such as the initiator, need an agent lookup
+            required = set(required_participants)
+            participant_roles: Dict[str, str] = {}
+            for role, agent_ids in (await self._get_project_agents_by_role(project_id)).items():
+                for agent_id in agent_ids:
+                    if agent_id in required:
+                        participant_roles[agent_id] = role
             
-            preferred_roles = facilitator_preferences.get(decision_type, ["senior_developer", "cto"])
+            unindexed = [p for p in required_participants if p not in participant_roles]
+            if unindexed:
+                agent_infos = await asyncio.gather(*(self._get_agent_info(p) for p in unindexed))
+                for participant_id, agent_info in zip(unindexed, agent_infos):
+                    if agent_info:
+                        participant_roles[participant_id] = agent_info.get("role", "").strip().lower()
             
-            # Get agent roles
+            # Index participants by role, then take the most preferred role present
+            participants_by_role: Dict[str, str] = {}
             for participant_id in required_participants:
-                agent_info = await self._get_agent_info(participant_id)
-                if agent_info and agent_info.get("role", "").lower() in [r.lower() for r in preferred_roles]:
+                role = participant_roles.get(participant_id)
+                if role is not None:
+                    participants_by_role.setdefault(role, participant_id)
+            
+            for role in preferred_roles:
+                participant_id = participants_by_role.get(role)
+                if participant_id:
                     return participant_id
             
             # Fallback to first required participant
@@ -494,51 +689,27 @@ class CollaborativeDecisionSystem:
             
             # Build participant list
             all_participants = decision.required_participants + decision.optional_participants
-            participant_mentions = []
-            for participant_id in all_participants:
-                agent_info = await self._get_agent_info(participant_id)
-                if agent_info:
-                    participant_mentions.append(f"@{agent_info.get('name', participant_id)}")
+            participant_infos = await asyncio.gather(
+                *(self._get_agent_info(participant_id) for participant_id in all_participants)
+            )
+            participant_mentions = ", ".join(
+                f"@{agent_info.get('name', participant_id)}"
+                for participant_id, agent_info in zip(all_participants, participant_infos)
+                if agent_info
+            )
             
             # Build options summary
-            options_summary = []
-            for i, option in enumerate(decision.options, 1):
-                options_summary.append(
-                    f"**Option {i}: {option.title}**\n"
-                    f"   • {option.description}\n"
-                    f"   • Effort: {option.implementation_effort.title()}, Risk: {option.risk_level.title()}\n"
-                    f"   • Pros: {', '.join(option.pros[:2])}{'...' if len(option.pros) > 2 else ''}\n"
-                )
+            options_summary = "\n".join(
+                f"**Option {i}: {option.title}**\n"
+                f"   • {option.description}\n"
+                f"   • Effort: {_level_title(option.implementation_effort)}, Risk: {_level_title(option.risk_level)}\n"
+                f"   • Pros: {', '.join(option.pros[:2])}{'...' if len(option.pros) > 2 else ''}\n"
+                for i, option in enumerate(decision.options, 1)
+            )
             
-            discussion_content = f"""🎯 **COLLABORATIVE DECISION REQUIRED**
-
-**Decision:** {decision.title}
-**Type:** {decision.decision_type.value.replace('_', ' ').title()}
-**Facilitator:** {facilitator_name}
-**Deadline:** {decision.deadline.strftime('%Y-%m-%d %H:%M')}
-
-**Context:**
-{decision.description}
-
-**Options to Consider:**
-{chr(10).join(options_summary)}
-
-**Participants:**
-{', '.join(participant_mentions)}
-
-**Next Steps:**
-1. 💭 **Discussion Phase**: Share your thoughts, concerns, and suggestions
-2. 🗳️ **Voting Phase**: Cast your votes with reasoning
-3. ✅ **Consensus Building**: Work toward agreement
-4. 📋 **Implementation**: Execute the decided approach
-
-**Discussion Guidelines:**
-• Consider all technical, business, and timeline implications
-• Share your expertise and concerns openly
-• Ask clarifying questions
-• Propose alternative solutions if needed
-
-Let's start the discussion! What are your initial thoughts on these options?"""
+            discussion_content = self._render_discussion_message(
+                decision, facilitator_name, options_summary, participant_mentions
+            )
 
             # Send the discussion initiation message
             message_id = await self.project_channel_manager.send_channel_message(
@@ -562,14 +733,18 @@ Let's start the discussion! What are your initial thoughts on these options?"""
                 decision.status = DecisionStatus.DISCUSSING
                 decision.updated_at = datetime.utcnow()
             
-            # Notify all participants
-            for participant_id in all_participants:
-                await self._notify_participant_of_decision(participant_id, decision)
+            # DM required participants; optional ones already got the channel @mention
+            notify_ids = (
+                all_participants if decision.notify_optional_privately
+                else decision.required_participants
+            )
+            await self._notify_participants_of_decision(notify_ids, decision)
             
             logger.log_system_event("decision_discussion_initiated", {
                 "decision_id": decision.id,
                 "channel_id": channel.id,
                 "participants": len(all_participants),
+                "notified": len(notify_ids),
                 "message_id": message_id
             })
             
@@ -579,77 +754,154 @@ Let's start the discussion! What are your initial thoughts on these options?"""
                 "decision_id": decision.id
             })
     
-    async def _notify_participant_of_decision(self, participant_id: str, decision: CollaborativeDecision):
-        """Notify a participant about a new decision requiring their input"""
-        try:
-            participant_info = await self._get_agent_info(participant_id)
-            if not participant_info:
-                return
-            
-            # Send direct notification
-            notification_content = f"""📋 **Decision Input Needed**
+    def _render_discussion_message(
+        self,
+        decision: CollaborativeDecision,
+        facilitator_name: str,
+        options_summary: str,
+        participant_mentions: str
+    ) -> str:
+        """Fill in the discussion kickoff message for a decision"""
+        return _DISCUSSION_TEMPLATE.format(
+            title=decision.title,
+            decision_type=_DECISION_TYPE_DISPLAY[decision.decision_type],
+            facilitator_name=facilitator_name,
+            deadline=_deadline_display(decision.deadline),
+            description=decision.description,
+            options_summary=options_summary,
+            participant_mentions=participant_mentions
+        )
+    
+    async def _notify_participants_of_decision(self, participant_ids: List[str], decision: CollaborativeDecision):
+        """Notify participants about a new decision requiring their input
+        
+        Required and optional participants each get one bulk message, so the
+        notification is built and sent once per role rather than per agent.
+        """
+        participant_infos = await asyncio.gather(
+            *(self._get_agent_info(participant_id) for participant_id in participant_ids)
+        )
+        required = set(decision.required_participants)
+        buckets: Dict[bool, List[str]] = {True: [], False: []}
+        for participant_id, participant_info in zip(participant_ids, participant_infos):
+            if participant_info:
+                buckets[participant_id in required].append(participant_id)
+        
+        for is_required, recipient_ids in buckets.items():
+            if not recipient_ids:
+                continue
+            try:
+                notification_content = f"""📋 **Decision Input Needed**
 
 You've been invited to participate in a collaborative decision for **{decision.title}**.
 
-**Decision Type:** {decision.decision_type.value.replace('_', ' ').title()}
-**Deadline:** {decision.deadline.strftime('%Y-%m-%d %H:%M')}
-**Your Role:** {'Required Participant' if participant_id in decision.required_participants else 'Optional Participant'}
+**Decision Type:** {_DECISION_TYPE_DISPLAY[decision.decision_type]}
+**Deadline:** {_deadline_display(decision.deadline)}
+**Your Role:** {'Required Participant' if is_required else 'Optional Participant'}
 
 Please join the discussion in the project channel and share your expertise and perspective.
 
 **Quick Summary:** {decision.description[:200]}{'...' if len(decision.description) > 200 else ''}"""
 
-            # Send via inter-agent communication
-            await self.inter_agent_comm.send_message(
-                from_agent_id="system",
-                to_agent_id=participant_id,
-                content=notification_content,
-                message_type="collaboration_request",
-                priority="high" if participant_id in decision.required_participants else "normal",
-                metadata={
-                    "decision_id": decision.id,
-                    "decision_type": decision.decision_type.value,
-                    "role": "required" if participant_id in decision.required_participants else "optional"
-                }
-            )
+                # Send via inter-agent communication
+                await self.inter_agent_comm.send_message_bulk(
+                    from_agent_id="system",
+                    to_agent_ids=recipient_ids,
+                    content=notification_content,
+                    subject=f"Decision Input Needed: {decision.title}",
+                    message_type="collaboration_request",
+                    priority="high" if is_required else "normal",
+                    metadata={
+                        "decision_id": decision.id,
+                        "decision_type": decision.decision_type.value,
+                        "role": "required" if is_required else "optional"
+                    }
+                )
+                
+            except Exception as e:
+                logger.log_error(e, {
+                    "action": "notify_participants_of_decision",
+                    "participants": recipient_ids,
+                    "decision_id": decision.id
+                })
+    
+    def _schedule(self, decision_id: str, phase: str, when: float):
+        """Queue a lifecycle phase to run for a decision at the given time.monotonic() reading"""
+        loop = asyncio.get_running_loop()
+        entry = (loop.time() + (when - time.monotonic()), phase, decision_id)
+        heapq.heappush(self._deadline_heap, entry)
+        
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+        elif self._deadline_heap[0] is entry:
+            # New earliest entry; wake the scheduler so it sleeps for less
+            self._scheduler_wakeup.set()
+    
+    async def _scheduler_loop(self):
+        """Run lifecycle phases as they fall due, sleeping until the earliest one"""
+        loop = asyncio.get_running_loop()
+        while self._deadline_heap:
+            delay = self._deadline_heap[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._scheduler_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._scheduler_wakeup.clear()
+                continue
             
-        except Exception as e:
-            logger.log_error(e, {
-                "action": "notify_participant_of_decision",
-                "participant_id": participant_id,
-                "decision_id": decision.id
-            })
+            _, phase, decision_id = heapq.heappop(self._deadline_heap)
+            # Held until done so a running phase isn't collected and shutdown can cancel it
+            task = asyncio.create_task(self._run_lifecycle_phase(decision_id, phase))
+            self._phase_tasks.add(task)
+            task.add_done_callback(self._phase_tasks.discard)
     
-    async def _manage_decision_lifecycle(self, decision_id: str):
-        """Manage the automated lifecycle of a decision"""
+    def _unschedule(self, decision_id: str):
+        """Drop a decision's pending lifecycle phases from the scheduler"""
+        head = self._deadline_heap[0] if self._deadline_heap else None
+        self._deadline_heap[:] = [entry for entry in self._deadline_heap if entry[2] != decision_id]
+        heapq.heapify(self._deadline_heap)
+        if head is not None and (not self._deadline_heap or self._deadline_heap[0] is not head):
+            # The scheduler was sleeping towards a dropped entry; let it re-arm
+            self._scheduler_wakeup.set()
+    
+    async def _settle_early(self, decision: CollaborativeDecision):
+        """Evaluate consensus ahead of the deadline once the votes have settled the outcome
+        
+        Votes landing while an evaluation is still awaiting its follow-up actions
+        wait on that evaluation instead of starting another.
+        """
+        await self._shared_lookup("settle", decision.id, lambda: self._evaluate_consensus(decision))
+    
+    async def _run_lifecycle_phase(self, decision_id: str, phase: str):
+        """Manage the automated lifecycle of a decision
+        
+        Phases whose decision has since moved on, for instance because votes
+        settled it early, are skipped.
+        """
         try:
-            await asyncio.sleep(300)  # Wait 5 minutes before first check
+            decision = self.active_decisions.get(decision_id)
+            if decision is None:
+                return
             
-            while decision_id in self.active_decisions:
-                decision = self.active_decisions[decision_id]
-                
-                if decision.status in [DecisionStatus.APPROVED, DecisionStatus.REJECTED, DecisionStatus.COMPLETED]:
-                    break
-                
-                current_time = datetime.utcnow()
-                
-                # Check if we need to move to voting phase
-                if (decision.status == DecisionStatus.DISCUSSING and 
-                    current_time >= decision.deadline - timedelta(minutes=30)):
-                    await self._transition_to_voting(decision)
-                
-                # Check if voting deadline has passed
-                elif (decision.status == DecisionStatus.VOTING and 
-                      current_time >= decision.deadline):
-                    await self._evaluate_consensus(decision)
-                
-                # Wait before next check
-                await asyncio.sleep(300)  # Check every 5 minutes
+            # Move to voting phase half an hour before the deadline
+            if phase == _PHASE_VOTING and decision.status == DecisionStatus.DISCUSSING:
+                await self._transition_to_voting(decision)
+                self._schedule(decision_id, _PHASE_EVALUATE, decision.deadline_monotonic)
+            
+            # Evaluate once the voting deadline has passed; try again only if
+            # the deadline was extended
+            elif phase == _PHASE_EVALUATE and decision.status == DecisionStatus.VOTING:
+                deadline = decision.deadline_monotonic
+                await self._evaluate_consensus(decision, at_deadline=True)
+                if decision.status == DecisionStatus.VOTING and decision.deadline_monotonic != deadline:
+                    self._schedule(decision_id, _PHASE_EVALUATE, decision.deadline_monotonic)
                 
         except Exception as e:
             logger.log_error(e, {
                 "action": "manage_decision_lifecycle",
-                "decision_id": decision_id
+                "decision_id": decision_id,
+                "phase": phase
             })
     
     async def _transition_to_voting(self, decision: CollaborativeDecision):
@@ -658,14 +910,19 @@ Please join the discussion in the project channel and share your expertise and p
             decision.status = DecisionStatus.VOTING
             decision.updated_at = datetime.utcnow()
             
-            # Get discussion channel
-            channel = await self.project_channel_manager.get_channel_by_type(
-                decision.project_id, ChannelType.GENERAL
+            # Get discussion channel and facilitator together
+            channel, facilitator_info = await asyncio.gather(
+                self.project_channel_manager.get_channel_by_type(
+                    decision.project_id, ChannelType.GENERAL
+                ),
+                self._get_agent_info(decision.facilitator)
             )
             
             if channel:
-                facilitator_info = await self._get_agent_info(decision.facilitator)
                 facilitator_name = facilitator_info.get("name", "Project Facilitator") if facilitator_info else "Project Facilitator"
+                options_list = "\n".join(
+                    f"**{i}. {opt.title}** - {opt.description}" for i, opt in enumerate(decision.options, 1)
+                )
                 
                 voting_content = f"""🗳️ **VOTING PHASE INITIATED**
 
@@ -675,10 +932,10 @@ The discussion period for **{decision.title}** has concluded. It's time to cast
 • Vote for your preferred option with reasoning
 • You can vote: Approve ✅, Reject ❌, Abstain ⚪, or Conditional ⚠️
 • **Required consensus:** {decision.minimum_consensus * 100:.0f}%
-• **Voting deadline:** {decision.deadline.strftime('%Y-%m-%d %H:%M')}
+• **Voting deadline:** {_deadline_display(decision.deadline)}
 
 **Options Available:**
-{chr(10).join([f"**{i+1}. {opt.title}** - {opt.description}" for i, opt in enumerate(decision.options)])}
+{options_list}
 
 Please respond with your vote and reasoning. Format: "I vote for Option X because..."
 
@@ -710,39 +967,260 @@ Required participants who haven't voted will receive reminders."""
                 "decision_id": decision.id
             })
     
-    async def _evaluate_consensus(self, decision: CollaborativeDecision):
-        """Evaluate if consensus has been reached and finalize decision"""
+    def _record_vote(
+        self,
+        decision: CollaborativeDecision,
+        agent_id: str,
+        option_id: str,
+        vote: VoteType,
+        reasoning: str = ""
+    ) -> bool:
+        """Record an agent's vote, replacing any earlier vote it cast on this decision"""
+        if decision.status not in _OPEN_STATUSES:
+            return False
+        
+        if len(decision.option_columns) != len(decision.options):
+            # Options were added since the index was built
+            decision.option_columns = {opt.id: i for i, opt in enumerate(decision.options)}
+        column = decision.option_columns.get(option_id)
+        if column is None:
+            return False
+        option = decision.options[column]
+        
+        for other in decision.options:
+            other.votes.pop(agent_id, None)
+            other.vote_reasoning.pop(agent_id, None)
+        option.votes[agent_id] = vote
+        if reasoning:
+            option.vote_reasoning[agent_id] = reasoning
+        
+        voter = decision.voter_rows.get(agent_id)
+        if voter is None:
+            # Someone outside the participant lists; give them a row of their own
+            voter = decision.voter_rows[agent_id] = len(decision.voter_rows)
+            matrix = self._vote_matrix(decision, voter)
+            decision.authority_weights[voter] = self._get_authority_weights([agent_id])[agent_id]
+            decision.eligible_weight += float(decision.authority_weights[voter])
+        else:
+            matrix = self._vote_matrix(decision, voter)
+        
+        # Move this voter's weight from any earlier vote to the new one
+        ballot = matrix[voter]
+        weight = float(decision.authority_weights[voter])
+        previous = np.flatnonzero(ballot != _NO_VOTE)
+        if previous.size:
+            previous_column = previous[0]
+            if ballot[previous_column] == _APPROVE_CODE:
+                decision.approval_weights[previous_column] -= weight
+            ballot[previous_column] = _NO_VOTE
+        else:
+            decision.total_votes += 1
+            decision.cast_weight += weight
+        code = _VOTE_CODES[vote]
+        ballot[column] = code
+        if code == _APPROVE_CODE:
+            decision.approval_weights[column] += weight
+        decision.updated_at = datetime.utcnow()
+        return True
+    
+    def _vote_matrix(self, decision: CollaborativeDecision, voter: int) -> np.ndarray:
+        """Return the decision's vote matrix, growing it to hold the given voter row and every option"""
+        matrix = decision.vote_matrix
+        options = len(decision.options)
+        if matrix is not None and matrix.shape[0] > voter and matrix.shape[1] >= options:
+            return matrix
+        
+        approval_weights = np.zeros(max(options, matrix.shape[1] if matrix is not None else 0))
+        if decision.approval_weights is not None:
+            approval_weights[:len(decision.approval_weights)] = decision.approval_weights
+        decision.approval_weights = approval_weights
+        
+        # Size for every participant up front; grow geometrically past that
+        voters = max(voter + 1, len(decision.voter_rows))
+        if matrix is not None:
+            voters = max(voters, matrix.shape[0] * 2 if voter >= matrix.shape[0] else matrix.shape[0])
+        grown = np.full((voters, options), _NO_VOTE, dtype=np.int8)
+        if matrix is not None:
+            grown[:matrix.shape[0], :matrix.shape[1]] = matrix
+        decision.vote_matrix = grown
+        
+        # Keep the weights aligned with the rows; spare rows weigh nothing
+        weights = np.zeros(voters, dtype=np.float32)
+        if decision.authority_weights is not None:
+            previous = decision.authority_weights[:voters]
+            weights[:len(previous)] = previous
+        decision.authority_weights = weights
+        return grown
+    
+    def _get_authority_weights(self, agent_ids: List[str]) -> Dict[str, float]:
+        """Get agents' voting weights, asking the hierarchy only about agents not cached"""
+        missing = [agent_id for agent_id in agent_ids if agent_id not in self._authority_weight_cache]
+        if missing:
+            self._authority_weight_cache.update(org_hierarchy.get_authority_weights(missing))
+        return {
+            agent_id: self._authority_weight_cache.get(agent_id, DEFAULT_AUTHORITY_WEIGHT)
+            for agent_id in agent_ids
+        }
+    
+    def _tally_votes(self, decision: CollaborativeDecision) -> Tuple[int, float, np.ndarray]:
+        """Return the number of voters, their combined authority weight, and the
+        authority-weighted approvals per option, indexed like decision.options"""
+        if decision.approval_weights is None:
+            return 0, 0.0, np.zeros(len(decision.options))
+        return decision.total_votes, decision.cast_weight, decision.approval_weights[:len(decision.options)]
+    
+    def _recount_votes(self, decision: CollaborativeDecision):
+        """Rebuild a decision's running tallies from its vote matrix
+        
+        _record_vote keeps the tallies current; this is only needed when the
+        matrix was restored or edited by other means.
+        """
+        matrix = decision.vote_matrix
+        if matrix is None:
+            return
+        weights = decision.authority_weights
+        # Each row holds at most one vote, so one max over the matrix yields
+        # every voter's code; only approving rows are revisited for their option
+        codes = matrix.max(axis=1)
+        voted = codes != _NO_VOTE
+        approving = codes == _APPROVE_CODE
+        decision.approval_weights = np.bincount(
+            matrix[approving].argmax(axis=1),
+            weights=weights[approving],
+            minlength=matrix.shape[1]
+        )
+        decision.total_votes = int(np.count_nonzero(voted))
+        decision.cast_weight = float(weights[voted].sum())
+        decision.eligible_weight = float(weights.sum())
+    
+    def _outcome_decided(self, decision: CollaborativeDecision) -> bool:
+        """Check whether the votes still outstanding can no longer change the consensus outcome"""
+        total_votes, cast_weight, approvals = self._tally_votes(decision)
+        leading = float(approvals.max()) if approvals.size else 0.0
+        # Unanimity is lost on the first vote that doesn't back the leader
+        if self._unanimity_broken(decision, cast_weight, leading):
+            return True
+        if total_votes < len(decision.required_participants) * MIN_PARTICIPATION:
+            return False
+        
+        if not leading:
+            return False
+        
+        total_weight = decision.eligible_weight
+        minimum_consensus = decision.minimum_consensus
+        # Consensus holds even if every outstanding voter picks something else
+        if leading / total_weight >= minimum_consensus:
+            return True
+        # No option can reach consensus even if every outstanding voter backs it
+        return (leading + total_weight - cast_weight) / total_weight < minimum_consensus
+    
+    @staticmethod
+    def _unanimity_broken(decision: CollaborativeDecision, cast_weight: float, leading: float) -> bool:
+        """Check whether a unanimous decision already has a vote against its leading option"""
+        return decision.minimum_consensus >= UNANIMITY_THRESHOLD and cast_weight > leading
+    
+    async def cast_vote(
+        self,
+        decision_id: str,
+        agent_id: str,
+        option_id: str,
+        vote: VoteType,
+        reasoning: str = ""
+    ) -> bool:
+        """Cast a vote, evaluating consensus as soon as the outcome is settled"""
+        decision = self.active_decisions.get(decision_id)
+        if decision is None or not self._record_vote(decision, agent_id, option_id, vote, reasoning):
+            return False
+        
+        if self._outcome_decided(decision):
+            await self._settle_early(decision)
+        return True
+    
+    async def collect_votes(
+        self,
+        decision_id: str,
+        ballots: Iterable[Awaitable[Tuple[str, str, VoteType, str]]]
+    ) -> int:
+        """Cast votes as (agent_id, option_id, vote, reasoning) ballots complete
+        
+        Once the outcome is settled, consensus is evaluated straight away and
+        the ballots still outstanding are cancelled rather than waited for.
+        """
+        decision = self.active_decisions.get(decision_id)
+        if decision is None:
+            return 0
+        
+        tasks = [asyncio.ensure_future(ballot) for ballot in ballots]
+        cast = 0
         try:
-            total_votes = 0
-            approve_votes = 0
-            option_votes = {}
-            
-            # Count votes across all options
-            for option in decision.options:
-                for agent_id, vote in option.votes.items():
-                    total_votes += 1
-                    if vote == VoteType.APPROVE:
-                        approve_votes += 1
-                        option_votes[option.id] = option_votes.get(option.id, 0) + 1
-            
+            for next_ballot in asyncio.as_completed(tasks):
+                try:
+                    agent_id, option_id, vote, reasoning = await next_ballot
+                except Exception as e:
+                    logger.log_error(e, {"action": "collect_votes", "decision_id": decision_id})
+                    continue
+                
+                if self._record_vote(decision, agent_id, option_id, vote, reasoning):
+                    cast += 1
+                    if self._outcome_decided(decision):
+                        await self._settle_early(decision)
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        return cast
+    
+    async def _evaluate_consensus(self, decision: CollaborativeDecision, at_deadline: bool = False):
+        """Evaluate if consensus has been reached and finalize decision
+        
+        The scheduler passes at_deadline when voting has closed; any other
+        caller is evaluating early.
+        """
+        # Settled decisions are never re-evaluated, so each outcome's follow-up
+        # actions run at most once
+        if decision.status not in _OPEN_STATUSES:
+            return
+        
+        # The tally only reads the running totals, so it stays outside the error
+        # handling; only the follow-up actions talk to other services
+        total_votes, cast_weight, approvals = self._tally_votes(decision)
+        
+        # Find winning option; argmax keeps the first of any tied options
+        winning_index = int(approvals.argmax()) if approvals.size else 0
+        winning_weight = float(approvals[winning_index]) if approvals.size else 0.0
+        
+        # Too early to judge: quorum isn't in and voting is still open. Escalating
+        # for low participation here would cut the voting window short
+        if (not at_deadline
+                and decision.status == DecisionStatus.VOTING
+                and total_votes < len(decision.required_participants) * MIN_PARTICIPATION
+                and time.monotonic() < decision.deadline_monotonic
+                and not self._unanimity_broken(decision, cast_weight, winning_weight)):
+            return
+        
+        now = datetime.utcnow()
+        status = decision.status
+        try:
+            if self._unanimity_broken(decision, cast_weight, winning_weight):
+                # No outstanding vote can restore unanimity, so resolve the conflict now
+                await self._hand_to_conflict_resolution(decision)
             # Check if minimum participation is met
-            required_participation = len(decision.required_participants)
-            if total_votes < required_participation * 0.8:  # At least 80% of required participants
+            elif total_votes < len(decision.required_participants) * MIN_PARTICIPATION:
                 await self._extend_deadline_or_escalate(decision, "insufficient_participation")
                 return
-            
-            # Find winning option
-            if option_votes:
-                winning_option_id = max(option_votes, key=option_votes.get)
-                winning_option = next(opt for opt in decision.options if opt.id == winning_option_id)
+            elif winning_weight:
+                winning_option = decision.options[winning_index]
+                winning_option_id = winning_option.id
                 
-                consensus_ratio = option_votes[winning_option_id] / total_votes
+                # Share of the authority weight cast that backs the winning option
+                consensus_ratio = winning_weight / cast_weight
                 
                 if consensus_ratio >= decision.minimum_consensus:
                     # Consensus reached
                     decision.status = DecisionStatus.CONSENSUS_REACHED
                     decision.selected_option = winning_option_id
-                    decision.decision_made_at = datetime.utcnow()
+                    decision.decision_made_at = now
                     
                     # Generate final reasoning
                     decision.final_reasoning = await self._generate_decision_reasoning(
@@ -759,18 +1237,25 @@ Required participants who haven't voted will receive reminders."""
                         await self._initiate_implementation(decision)
                 else:
                     # No consensus, try conflict resolution
-                    await self._initiate_conflict_resolution(decision)
+                    await self._hand_to_conflict_resolution(decision)
             else:
                 # No votes, escalate
                 await self._extend_deadline_or_escalate(decision, "no_votes")
             
-            decision.updated_at = datetime.utcnow()
+            # Only stamp decisions this evaluation actually moved on
+            if decision.status != status:
+                decision.updated_at = now
             
         except Exception as e:
             logger.log_error(e, {
                 "action": "evaluate_consensus",
                 "decision_id": decision.id
             })
+        finally:
+            # Whatever the outcome, a decision that has left voting needs no
+            # further lifecycle phases
+            if decision.status not in _OPEN_STATUSES:
+                self._unschedule(decision.id)
     
     async def _generate_decision_reasoning(
         self, 
@@ -779,59 +1264,91 @@ Required participants who haven't voted will receive reminders."""
         consensus_ratio: float
     ) -> str:
         """Generate comprehensive reasoning for the decision"""
+        # Reasoning is fixed once an option is selected; don't rebuild it on re-evaluation
+        if decision.final_reasoning and decision.selected_option == winning_option.id:
+            return decision.final_reasoning
+        
+        consensus_pct = f"{consensus_ratio * 100:.1f}%"
         try:
-            reasoning_parts = [
-                f"**Decision:** {winning_option.title}",
-                f"**Consensus Level:** {consensus_ratio * 100:.1f}% ({consensus_ratio:.2f} ratio)",
-                f"**Primary Reasons:**"
-            ]
-            
-            # Collect reasoning from votes
-            unique_reasons = set()
-            for agent_id, reason in winning_option.vote_reasoning.items():
-                if reason and reason not in unique_reasons:
-                    unique_reasons.add(reason)
-                    reasoning_parts.append(f"• {reason}")
-            
-            # Add implementation details
-            reasoning_parts.extend([
-                f"**Implementation Effort:** {winning_option.implementation_effort.title()}",
-                f"**Risk Level:** {winning_option.risk_level.title()}",
-                f"**Key Benefits:** {', '.join(winning_option.pros[:3])}"
-            ])
-            
-            if winning_option.timeline_impact:
-                reasoning_parts.append(f"**Timeline Impact:** {winning_option.timeline_impact}")
-            
-            return "\n".join(reasoning_parts)
+            # Distinct reasons from the votes, in the order they were given
+            reasons = "".join(
+                f"• {reason}\n"
+                for reason in dict.fromkeys(winning_option.vote_reasoning.values()) if reason
+            )
+            timeline = (
+                f"\n**Timeline Impact:** {winning_option.timeline_impact}"
+                if winning_option.timeline_impact else ""
+            )
+            
+            return _REASONING_TEMPLATE.format(
+                title=winning_option.title,
+                pct=consensus_pct,
+                ratio=consensus_ratio,
+                reasons=reasons,
+                effort=_level_title(winning_option.implementation_effort),
+                risk=_level_title(winning_option.risk_level),
+                benefits=", ".join(winning_option.pros[:3]),
+                timeline=timeline
+            )
             
         except Exception as e:
             logger.log_error(e, {"action": "generate_decision_reasoning"})
-            return f"Decision made for {winning_option.title} with {consensus_ratio * 100:.1f}% consensus."
+            return f"Decision made for {winning_option.title} with {consensus_pct} consensus."
     
     # Helper methods
-    async def _get_project_agents(self, project_id: str) -> Dict[str, Dict[str, Any]]:
+    async def _get_project_agents(self, project_id: str) -> Mapping[str, Mapping[str, Any]]:
         """Get agents assigned to a project"""
         # This would integrate with your project management system
         # For now, return a mock structure
-        return {
-            "cto-001": {"role": "CTO", "name": "Technical Director"},
-            "dev-001": {"role": "Senior Developer", "name": "Lead Developer"},
-            "dev-002": {"role": "Developer", "name": "Backend Developer"},
-            "qa-001": {"role": "QA Engineer", "name": "Quality Assurance"}
-        }
+        return _PROJECT_AGENTS
+    
+    async def _shared_lookup(self, kind: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch() once for concurrent lookups of the same key, handing every caller its result"""
+        future = self._inflight_lookups.get((kind, key))
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight_lookups[(kind, key)] = future
+            future.add_done_callback(lambda _: self._inflight_lookups.pop((kind, key), None))
+        # Shielded so one caller being cancelled doesn't cancel the lookup for the rest
+        return await asyncio.shield(future)
+    
+    async def _get_project_agents_by_role(self, project_id: str) -> Dict[str, List[str]]:
+        """Get a project's agent ids grouped by lowercased role, built once per project"""
+        agents_by_role = self._project_agents_by_role.get(project_id)
+        if agents_by_role is None:
+            agents_by_role = await self._shared_lookup(
+                "project_roles", project_id, lambda: self._build_project_role_index(project_id)
+            )
+        return agents_by_role
+    
+    async def _build_project_role_index(self, project_id: str) -> Dict[str, List[str]]:
+        """Group a project's agent ids by lowercased role and remember the index"""
+        agents_by_role: Dict[str, List[str]] = {}
+        for agent_id, agent_info in (await self._get_project_agents(project_id)).items():
+            role_key = agent_info.get("role", "").strip().lower()
+            agents_by_role.setdefault(role_key, []).append(agent_id)
+        self._project_agents_by_role[project_id] = agents_by_role
+        return agents_by_role
     
-    async def _get_agent_info(self, agent_id: str) -> Optional[Dict[str, Any]]:
-        """Get information about an agent"""
+    def invalidate_project_agents(self, project_id: str):
+        """Drop the cached role index when a project's team changes"""
+        self._project_agents_by_role.pop(project_id, None)
+    
+    async def _get_agent_info(self, agent_id: str) -> Optional[Mapping[str, Any]]:
+        """Get information about an agent, reusing recent lookups"""
+        agent_info = self._agent_info_cache.get(agent_id)
+        if agent_info is None:
+            agent_info = await self._shared_lookup(
+                "agent_info", agent_id, lambda: self._fetch_agent_info(agent_id)
+            )
+            if agent_info is not None:
+                self._agent_info_cache[agent_id] = agent_info
+        return agent_info
+    
+    async def _fetch_agent_info(self, agent_id: str) -> Optional[Mapping[str, Any]]:
+        """Look up information about an agent"""
         # This would integrate with your agent management system
-        agent_mapping = {
-            "cto-001": {"name": "Technical Director", "role": "CTO"},
-            "dev-001": {"name": "Lead Developer", "role": "Senior Developer"},
-            "dev-002": {"name": "Backend Developer", "role": "Developer"},
-            "qa-001": {"name": "Quality Assurance", "role": "QA Engineer"},
-            "system": {"name": "System", "role": "System"}
-        }
-        return agent_mapping.get(agent_id)
+        return _AGENT_MAPPING.get(agent_id)
     
     async def _announce_decision_result(self, decision: CollaborativeDecision, consensus_reached: bool):
         """Announce the result of a decision"""
@@ -848,6 +1365,12 @@ Required participants who haven't voted will receive reminders."""
         # Implementation for starting implementation
         pass
     
+    async def _hand_to_conflict_resolution(self, decision: CollaborativeDecision):
+        """Close voting on a decision that failed to reach consensus and start resolving it"""
+        # Set before anything is awaited so concurrent evaluations see it settled
+        decision.status = DecisionStatus.CONFLICT_RESOLUTION
+        await self._initiate_conflict_resolution(decision)
+    
     async def _initiate_conflict_resolution(self, decision: CollaborativeDecision):
         """Start conflict resolution process when consensus isn't reached"""
         # Implementation for conflict resolution
@@ -857,6 +1380,15 @@ Required participants who haven't voted will receive reminders."""
         """Extend deadline or escalate decision to higher authority"""
         # Implementation for deadline extension or escalation
         pass
+    
+    async def shutdown(self):
+        """Cleanup resources"""
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+        for task in list(self._phase_tasks):
+            task.cancel()
+        await asyncio.gather(*self._phase_tasks, return_exceptions=True)
 
 
 # Global instance will be created when dependencies are available
@@ -4,21 +4,34 @@ Handles disagreements, conflicting opinions, and dispute resolution between agen
 """
 
 import asyncio
+import bisect
+import heapq
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Set, Tuple, Mapping
 from dataclasses import dataclass, asdict
 from enum import Enum
 import json
 
+import numpy as np
+from cachetools import TTLCache
+
 from core.logging import get_logger
 from services.inter_agent_communication import InterAgentCommunicationService
 from services.project_channel_manager import ProjectChannelManager, ChannelType
-from services.organizational_hierarchy import organizational_hierarchy
+from services.organizational_hierarchy import org_hierarchy
 from models.organizational_hierarchy import Agent, AuthorityLevel
 
 logger = get_logger(__name__)
 
+# Resolution steps run by the conflict supervisor
+_PHASE_ANALYZE = "analyze"
+_PHASE_TIMEOUT = "timeout"
+# Agent info is looked up for every announcement and position request; keep it briefly
+AGENT_INFO_CACHE_SIZE = 4096
+AGENT_INFO_TTL_SECONDS = 60
+
 
 class ConflictType(str, Enum):
     TECHNICAL_DISAGREEMENT = "technical_disagreement"
@@ -59,7 +72,78 @@ class ResolutionStrategy(str, Enum):
     DATA_DRIVEN = "data_driven"       # Let metrics/data decide
 
 
-@dataclass
+# Lower bounds of the severity scores for MEDIUM, HIGH and CRITICAL, in order
+_SEVERITY_THRESHOLDS = (0.5, 0.7, 0.9)
+_SEVERITY_BANDS = (ConflictSeverity.LOW, ConflictSeverity.MEDIUM, ConflictSeverity.HIGH, ConflictSeverity.CRITICAL)
+
+# Preferred resolution strategies for each conflict type, best first
+_RESOLUTION_STRATEGIES: Mapping[ConflictType, Tuple[ResolutionStrategy, ...]] = MappingProxyType({
+    ConflictType.TECHNICAL_DISAGREEMENT: (
+        ResolutionStrategy.TECHNICAL_REVIEW,
+        ResolutionStrategy.DATA_DRIVEN,
+        ResolutionStrategy.COLLABORATIVE
+    ),
+    ConflictType.PRIORITY_CONFLICT: (
+        ResolutionStrategy.DATA_DRIVEN,
+        ResolutionStrategy.COMPROMISE,
+        ResolutionStrategy.COMPETITION
+    ),
+    ConflictType.RESOURCE_ALLOCATION: (
+        ResolutionStrategy.COMPROMISE,
+        ResolutionStrategy.COMPETITION,
+        ResolutionStrategy.COLLABORATIVE
+    ),
+    ConflictType.TIMELINE_DISPUTE: (
+        ResolutionStrategy.DATA_DRIVEN,
+        ResolutionStrategy.COMPROMISE,
+        ResolutionStrategy.TECHNICAL_REVIEW
+    ),
+    ConflictType.APPROACH_DIFFERENCE: (
+        ResolutionStrategy.COLLABORATIVE,
+        ResolutionStrategy.TECHNICAL_REVIEW,
+        ResolutionStrategy.COMPROMISE
+    ),
+    ConflictType.QUALITY_STANDARDS: (
+        ResolutionStrategy.TECHNICAL_REVIEW,
+        ResolutionStrategy.COLLABORATIVE,
+        ResolutionStrategy.COMPETITION
+    ),
+    ConflictType.ARCHITECTURAL_CHOICE: (
+        ResolutionStrategy.TECHNICAL_REVIEW,
+        ResolutionStrategy.DATA_DRIVEN,
+        ResolutionStrategy.COMPETITION
+    ),
+    ConflictType.PROCESS_DISAGREEMENT: (
+        ResolutionStrategy.COLLABORATIVE,
+        ResolutionStrategy.COMPROMISE,
+        ResolutionStrategy.ACCOMMODATION
+    ),
+    ConflictType.RESPONSIBILITY_OVERLAP: (
+        ResolutionStrategy.COLLABORATIVE,
+        ResolutionStrategy.COMPETITION,
+        ResolutionStrategy.ACCOMMODATION
+    ),
+    ConflictType.COMMUNICATION_BREAKDOWN: (
+        ResolutionStrategy.COLLABORATIVE,
+        ResolutionStrategy.ACCOMMODATION,
+        ResolutionStrategy.AVOIDANCE
+    )
+})
+
+# Mediation skill (0.0-1.0) by lowercased agent role
+_MEDIATION_SKILLS: Mapping[str, float] = MappingProxyType({
+    "ceo": 0.9,
+    "cto": 0.8,
+    "project_manager": 0.9,
+    "senior_developer": 0.7,
+    "architect": 0.8,
+    "developer": 0.5,
+    "qa_engineer": 0.6,
+    "devops": 0.6
+})
+
+
+@dataclass(slots=True)
 class ConflictPosition:
     """Represents one party's position in a conflict"""
     agent_id: str
@@ -77,7 +161,7 @@ class ConflictPosition:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class MediationSession:
     """Represents a structured mediation session"""
     id: str
@@ -93,7 +177,7 @@ class MediationSession:
     status: str  # scheduled, in_progress, completed, cancelled
 
 
-@dataclass
+@dataclass(slots=True)
 class Conflict:
     """Represents a conflict between agents"""
     id: str
@@ -133,82 +217,14 @@ class ConflictResolutionSystem:
         self.inter_agent_comm = inter_agent_comm
         self.project_channel_manager = project_channel_manager
         self.active_conflicts: Dict[str, Conflict] = {}
-        self.resolution_strategies: Dict[ConflictType, List[ResolutionStrategy]] = {}
-        self.mediation_skills: Dict[str, float] = {}  # agent_id -> mediation skill (0.0-1.0)
-        
-        # Initialize resolution strategies
-        self._initialize_resolution_strategies()
-        
-        # Initialize agent mediation skills
-        self._initialize_mediation_skills()
-    
-    def _initialize_resolution_strategies(self):
-        """Initialize preferred resolution strategies for different conflict types"""
-        self.resolution_strategies = {
-            ConflictType.TECHNICAL_DISAGREEMENT: [
-                ResolutionStrategy.TECHNICAL_REVIEW,
-                ResolutionStrategy.DATA_DRIVEN,
-                ResolutionStrategy.COLLABORATIVE
-            ],
-            ConflictType.PRIORITY_CONFLICT: [
-                ResolutionStrategy.DATA_DRIVEN,
-                ResolutionStrategy.COMPROMISE,
-                ResolutionStrategy.COMPETITION
-            ],
-            ConflictType.RESOURCE_ALLOCATION: [
-                ResolutionStrategy.COMPROMISE,
-                ResolutionStrategy.COMPETITION,
-                ResolutionStrategy.COLLABORATIVE
-            ],
-            ConflictType.TIMELINE_DISPUTE: [
-                ResolutionStrategy.DATA_DRIVEN,
-                ResolutionStrategy.COMPROMISE,
-                ResolutionStrategy.TECHNICAL_REVIEW
-            ],
-            ConflictType.APPROACH_DIFFERENCE: [
-                ResolutionStrategy.COLLABORATIVE,
-                ResolutionStrategy.TECHNICAL_REVIEW,
-                ResolutionStrategy.COMPROMISE
-            ],
-            ConflictType.QUALITY_STANDARDS: [
-                ResolutionStrategy.TECHNICAL_REVIEW,
-                ResolutionStrategy.COLLABORATIVE,
-                ResolutionStrategy.COMPETITION
-            ],
-            ConflictType.ARCHITECTURAL_CHOICE: [
-                ResolutionStrategy.TECHNICAL_REVIEW,
-                ResolutionStrategy.DATA_DRIVEN,
-                ResolutionStrategy.COMPETITION
-            ],
-            ConflictType.PROCESS_DISAGREEMENT: [
-                ResolutionStrategy.COLLABORATIVE,
-                ResolutionStrategy.COMPROMISE,
-                ResolutionStrategy.ACCOMMODATION
-            ],
-            ConflictType.RESPONSIBILITY_OVERLAP: [
-                ResolutionStrategy.COLLABORATIVE,
-                ResolutionStrategy.COMPETITION,
-                ResolutionStrategy.ACCOMMODATION
-            ],
-            ConflictType.COMMUNICATION_BREAKDOWN: [
-                ResolutionStrategy.COLLABORATIVE,
-                ResolutionStrategy.ACCOMMODATION,
-                ResolutionStrategy.AVOIDANCE
-            ]
-        }
-    
-    def _initialize_mediation_skills(self):
-        """Initialize mediation skills for different agent types"""
-        self.mediation_skills = {
-            "ceo": 0.9,
-            "cto": 0.8,
-            "project_manager": 0.9,
-            "senior_developer": 0.7,
-            "architect": 0.8,
-            "developer": 0.5,
-            "qa_engineer": 0.6,
-            "devops": 0.6
-        }
+        # (loop time, phase, conflict_id) entries for the supervisor, earliest first
+        self._deadline_heap: List[Tuple[float, str, str]] = []
+        self._supervisor_wakeup = asyncio.Event()
+        self._supervisor_task: Optional[asyncio.Task] = None
+        self._phase_tasks: Set[asyncio.Task] = set()
+        self._agent_info_cache: TTLCache = TTLCache(maxsize=AGENT_INFO_CACHE_SIZE, ttl=AGENT_INFO_TTL_SECONDS)
+        self.resolution_strategies = _RESOLUTION_STRATEGIES
+        self.mediation_skills = _MEDIATION_SKILLS
     
     async def detect_potential_conflict(
         self,
@@ -351,14 +367,7 @@ class ConflictResolutionSystem:
     
     def _determine_severity(self, severity_score: float) -> ConflictSeverity:
         """Determine conflict severity based on indicators"""
-        if severity_score >= 0.9:
-            return ConflictSeverity.CRITICAL
-        elif severity_score >= 0.7:
-            return ConflictSeverity.HIGH
-        elif severity_score >= 0.5:
-            return ConflictSeverity.MEDIUM
-        else:
-            return ConflictSeverity.LOW
+        return _SEVERITY_BANDS[bisect.bisect_right(_SEVERITY_THRESHOLDS, severity_score)]
     
     async def _determine_escalation_path(
         self, 
@@ -370,11 +379,8 @@ class ConflictResolutionSystem:
         escalation_path = []
         
         # Get roles of affected agents
-        agent_roles = []
-        for agent_id in affected_agents:
-            agent_info = await self._get_agent_info(agent_id)
-            if agent_info:
-                agent_roles.append(agent_info.get("role", "").lower())
+        agent_infos = await asyncio.gather(*(self._get_agent_info(agent_id) for agent_id in affected_agents))
+        agent_roles = [agent_info.get("role", "").lower() for agent_info in agent_infos if agent_info]
         
         # Determine escalation based on severity and roles involved
         if severity == ConflictSeverity.CRITICAL:
@@ -470,8 +476,9 @@ class ConflictResolutionSystem:
     async def _gather_initial_positions(self, conflict: Conflict):
         """Gather initial positions from all affected agents"""
         try:
-            for agent_id in conflict.affected_agents:
-                await self._request_position_statement(conflict, agent_id)
+            await asyncio.gather(*(
+                self._request_position_statement(conflict, agent_id) for agent_id in conflict.affected_agents
+            ))
             
             # Start position gathering phase
             conflict.status = ConflictStatus.MEDIATING
@@ -552,8 +559,15 @@ Please respond with your position statement. This will help us work toward a mut
             if not conflict.channel_id:
                 return
             
-            mediator_info = await self._get_agent_info(conflict.mediator)
+            mediator_info, *agent_infos = await asyncio.gather(
+                self._get_agent_info(conflict.mediator),
+                *(self._get_agent_info(aid) for aid in conflict.affected_agents)
+            )
             mediator_name = mediator_info.get("name", "Conflict Mediator") if mediator_info else "Conflict Mediator"
+            affected_mentions = ''.join(
+                f'• @{(agent_info or {}).get("name", aid)}\n'
+                for aid, agent_info in zip(conflict.affected_agents, agent_infos)
+            )
             
             # Announce conflict resolution process
             announcement_content = f"""🎯 **CONFLICT RESOLUTION INITIATED**
@@ -566,7 +580,7 @@ A conflict has been identified and we're starting a structured resolution proces
 **Mediator:** {mediator_name}
 
 **Affected Team Members:**
-{''.join([f'• @{(await self._get_agent_info(aid) or {}).get("name", aid)}' + chr(10) for aid in conflict.affected_agents])}
+{affected_mentions}
 
 **Resolution Process:**
 1. **Position Gathering** - Each party shares their perspective
@@ -601,7 +615,7 @@ I'll be facilitating this process to ensure we reach a constructive resolution.
             )
             
             # Schedule resolution management
-            asyncio.create_task(self._manage_resolution_process(conflict.id))
+            self._schedule(conflict.id, _PHASE_TIMEOUT, conflict.resolution_deadline)
             
         except Exception as e:
             logger.log_error(e, {
@@ -609,34 +623,63 @@ I'll be facilitating this process to ensure we reach a constructive resolution.
                 "conflict_id": conflict.id
             })
     
-    async def _manage_resolution_process(self, conflict_id: str):
-        """Manage the automated resolution process"""
+    def _schedule(self, conflict_id: str, phase: str, when: datetime):
+        """Queue a resolution phase to run for a conflict at the given UTC time"""
+        loop = asyncio.get_running_loop()
+        entry = (loop.time() + (when - datetime.utcnow()).total_seconds(), phase, conflict_id)
+        heapq.heappush(self._deadline_heap, entry)
+        
+        if self._supervisor_task is None or self._supervisor_task.done():
+            self._supervisor_task = asyncio.create_task(self._supervise_resolutions())
+        elif self._deadline_heap[0] is entry:
+            # New earliest entry; wake the supervisor so it sleeps for less
+            self._supervisor_wakeup.set()
+    
+    async def _supervise_resolutions(self):
+        """Run resolution phases as they fall due, sleeping until the earliest one"""
+        loop = asyncio.get_running_loop()
+        while self._deadline_heap:
+            delay = self._deadline_heap[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._supervisor_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._supervisor_wakeup.clear()
+                continue
+            
+            _, phase, conflict_id = heapq.heappop(self._deadline_heap)
+            # Held until done so a running phase isn't collected and shutdown can cancel it
+            task = asyncio.create_task(self._manage_resolution_process(conflict_id, phase))
+            self._phase_tasks.add(task)
+            task.add_done_callback(self._phase_tasks.discard)
+    
+    async def _manage_resolution_process(self, conflict_id: str, phase: str):
+        """Manage the automated resolution process
+        
+        Phases for conflicts that have since been settled are skipped.
+        """
         try:
-            while conflict_id in self.active_conflicts:
-                conflict = self.active_conflicts[conflict_id]
-                
-                if conflict.status in [ConflictStatus.RESOLVED, ConflictStatus.UNRESOLVABLE]:
-                    break
-                
-                current_time = datetime.utcnow()
-                
-                # Check if deadline has passed
-                if current_time >= conflict.resolution_deadline:
-                    await self._handle_resolution_timeout(conflict)
-                    break
-                
-                # Check if we have all positions
-                if (len(conflict.positions) == len(conflict.affected_agents) and 
-                    conflict.status == ConflictStatus.MEDIATING):
-                    await self._analyze_positions_and_suggest_resolution(conflict)
-                
-                # Wait before next check
-                await asyncio.sleep(300)  # Check every 5 minutes
+            conflict = self.active_conflicts.get(conflict_id)
+            if conflict is None or conflict.status in (ConflictStatus.RESOLVED, ConflictStatus.UNRESOLVABLE):
+                return
+            
+            # Check if deadline has passed
+            if phase == _PHASE_TIMEOUT:
+                await self._handle_resolution_timeout(conflict)
+            
+            # Check if we have all positions
+            elif (phase == _PHASE_ANALYZE
+                    and datetime.utcnow() < conflict.resolution_deadline
+                    and len(conflict.positions) == len(conflict.affected_agents)
+                    and conflict.status == ConflictStatus.MEDIATING):
+                await self._analyze_positions_and_suggest_resolution(conflict)
                 
         except Exception as e:
             logger.log_error(e, {
                 "action": "manage_resolution_process",
-                "conflict_id": conflict_id
+                "conflict_id": conflict_id,
+                "phase": phase
             })
     
     async def add_position_to_conflict(
@@ -681,6 +724,10 @@ I'll be facilitating this process to ensure we reach a constructive resolution.
             conflict.positions.append(position)
             conflict.updated_at = datetime.utcnow()
             
+            # Analyze as soon as the last position is in, for conflicts under management
+            if conflict.channel_id and len(conflict.positions) == len(conflict.affected_agents):
+                self._schedule(conflict_id, _PHASE_ANALYZE, conflict.updated_at)
+            
             logger.log_system_event("conflict_position_added", {
                 "conflict_id": conflict_id,
                 "agent_id": agent_id,
@@ -706,7 +753,7 @@ I'll be facilitating this process to ensure we reach a constructive resolution.
             common_ground = self._identify_common_ground(conflict.positions)
             
             # Select resolution strategy
-            strategies = self.resolution_strategies.get(conflict.conflict_type, [ResolutionStrategy.COLLABORATIVE])
+            strategies = self.resolution_strategies.get(conflict.conflict_type, (ResolutionStrategy.COLLABORATIVE,))
             selected_strategy = await self._select_resolution_strategy(conflict, compatibility_matrix)
             
             conflict.resolution_strategy = selected_strategy
@@ -735,8 +782,8 @@ I'll be facilitating this process to ensure we reach a constructive resolution.
             return compatibility
         
         # Simple compatibility calculation based on flexibility levels
-        total_flexibility = sum(p.flexibility_level for p in positions)
-        avg_flexibility = total_flexibility / len(positions)
+        flexibility = np.fromiter((p.flexibility_level for p in positions), dtype=np.float64, count=len(positions))
+        avg_flexibility = float(flexibility.mean())
         
         compatibility["overall_score"] = avg_flexibility
         compatibility["compromise_potential"] = avg_flexibility
@@ -776,7 +823,7 @@ I'll be facilitating this process to ensure we reach a constructive resolution.
         compatibility_matrix: Dict[str, Any]
     ) -> ResolutionStrategy:
         """Select the best resolution strategy based on conflict analysis"""
-        strategies = self.resolution_strategies.get(conflict.conflict_type, [ResolutionStrategy.COLLABORATIVE])
+        strategies = self.resolution_strategies.get(conflict.conflict_type, (ResolutionStrategy.COLLABORATIVE,))
         
         compatibility_score = compatibility_matrix.get("overall_score", 0.5)
         
@@ -941,7 +988,16 @@ Please share your thoughts on this analysis and proposed approach. Are you willi
         }
     
     async def _get_agent_info(self, agent_id: str) -> Optional[Dict[str, Any]]:
-        """Get information about an agent"""
+        """Get information about an agent, reusing recent lookups"""
+        agent_info = self._agent_info_cache.get(agent_id)
+        if agent_info is None:
+            agent_info = await self._fetch_agent_info(agent_id)
+            if agent_info is not None:
+                self._agent_info_cache[agent_id] = agent_info
+        return agent_info
+    
+    async def _fetch_agent_info(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Look up information about an agent"""
         agent_mapping = {
             "cto-001": {"name": "Technical Director", "role": "CTO", "expertise": ["architecture", "strategy"]},
             "dev-001": {"name": "Lead Developer", "role": "Senior Developer", "expertise": ["backend", "api"]},
@@ -955,6 +1011,15 @@ Please share your thoughts on this analysis and proposed approach. Are you willi
         """Handle when conflict resolution timeout is reached"""
         # Implementation for timeout handling
         pass
+    
+    async def shutdown(self):
+        """Cleanup resources"""
+        if self._supervisor_task is not None:
+            self._supervisor_task.cancel()
+            self._supervisor_task = None
+        for task in list(self._phase_tasks):
+            task.cancel()
+        await asyncio.gather(*self._phase_tasks, return_exceptions=True)
 
 
 # Global instance will be created when dependencies are available
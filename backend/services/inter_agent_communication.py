@@ -187,6 +187,57 @@ class InterAgentCommunicationService:
         
         return message_id
     
+    async def send_message_bulk(self, from_agent_id: str, to_agent_ids: List[str],
+                              content: str, subject: str = "Direct Message",
+                              message_type: MessageType = MessageType.DIRECT,
+                              priority = MessagePriority.NORMAL,
+                              metadata: Dict[str, Any] = None) -> List[str]:
+        """Send the same direct message to several agents, validating the payload once"""
+        if not from_agent_id or not content:
+            raise ValueError("from_agent_id and content are required")
+        
+        # Handle priority parameter that might be string or enum
+        if isinstance(priority, str):
+            priority_map = {
+                "low": MessagePriority.LOW,
+                "normal": MessagePriority.NORMAL, 
+                "high": MessagePriority.HIGH,
+                "urgent": MessagePriority.URGENT
+            }
+            priority = priority_map.get(priority.lower(), MessagePriority.NORMAL)
+        
+        # Build and validate the message once; each recipient gets an unvalidated copy
+        template = AgentMessage(
+            id="",
+            from_agent_id=from_agent_id,
+            message_type=message_type,
+            priority=priority,
+            subject=subject,
+            content=content,
+            metadata=metadata or {}
+        )
+        
+        messages = [
+            template.model_copy(update={"id": str(uuid.uuid4()), "to_agent_id": recipient_id})
+            for recipient_id in to_agent_ids
+        ]
+        for message in messages:
+            self.messages[message.id] = message
+        
+        await asyncio.gather(*(
+            self._notify_agent_message_received(message.to_agent_id, message)
+            for message in messages
+        ))
+        
+        logger.log_system_event("bulk_message_sent", {
+            "from_agent": from_agent_id,
+            "recipients": len(messages),
+            "message_type": template.message_type.value,
+            "priority": priority.value
+        })
+        
+        return [message.id for message in messages]
+    
     async def send_team_message(self, from_agent_id: str, team_id: str,
                               subject: str, content: str,
                               priority: MessagePriority = MessagePriority.NORMAL) -> str:
@@ -23,6 +23,15 @@ from core.config import settings
 
 logger = get_logger(__name__)
 
+# Voting weight each authority level carries in collaborative decisions
+AUTHORITY_WEIGHTS = {
+    AuthorityLevel.INTERN: 0.5,
+    AuthorityLevel.INDIVIDUAL_CONTRIBUTOR: 1.0,
+    AuthorityLevel.MIDDLE_MANAGEMENT: 1.5,
+    AuthorityLevel.SENIOR_MANAGEMENT: 2.0,
+    AuthorityLevel.EXECUTIVE: 3.0
+}
+
 
 class OrganizationalHierarchyService:
     """Service managing organizational structure and accountability"""
@@ -784,6 +793,13 @@ Request ID: {request.id}
         position = self.org_chart.positions.get(agent_id)
         return position.authority_level if position else None
     
+    def get_authority_weights(self, agent_ids: List[str]) -> Dict[str, float]:
+        """Get collaborative-decision voting weights for agents by authority level"""
+        return {
+            agent_id: AUTHORITY_WEIGHTS.get(self.get_authority_level(agent_id), 1.0)
+            for agent_id in agent_ids
+        }
+    
     def can_approve_decision(self, agent_id: str, decision_type: DecisionType, 
                            amount: Optional[int] = None) -> bool:
         """Check if an agent can approve a specific decision"""
@@ -141,7 +141,7 @@ class ProjectChannelManager:
         project_name: str,
         created_by: str,
         initial_participants: List[str] = None
-    ) -> List[str]:
+    ) -> List[ProjectChannel]:
         """Create all default channels for a new project"""
         try:
             created_channels = []
@@ -160,13 +160,13 @@ class ProjectChannelManager:
                 )
                 
                 if channel_id:
-                    created_channels.append(channel_id)
+                    created_channels.append(self.channel_index[channel_id])
             
             logger.log_system_event("project_channels_created", {
                 "project_id": project_id,
                 "project_name": project_name,
                 "channels_created": len(created_channels),
-                "channel_ids": created_channels
+                "channel_ids": [channel.id for channel in created_channels]
             })
             
             return created_channels
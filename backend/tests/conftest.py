@@ -0,0 +1,48 @@
+import importlib.util
+import os
+import sys
+import types
+
+# Add the backend directory to Python path so tests import services the way main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Model modules the services import from the models package
+MODEL_MODULES = ("agent", "auto_scaling_hr", "organizational_hierarchy")
+
+
+class _PlaceholderModel(type):
+    """Stand-in for a model class: members resolve to their own names and it iterates as empty"""
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return name
+
+    def __iter__(cls):
+        return iter(())
+
+
+class _PlaceholderModule(types.ModuleType):
+    """Stand-in for a models module that hands out a placeholder for any class imported from it"""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        model = _PlaceholderModel(name, (), {
+            "__init__": lambda self, *args, **fields: self.__dict__.update(fields)
+        })
+        setattr(self, name, model)
+        return model
+
+
+# The models package isn't part of this tree. Without it, placeholders stand in
+# so the services importing it can load; the tests only cover logic that
+# doesn't depend on how the real models behave
+if importlib.util.find_spec("models") is None:
+    models = types.ModuleType("models")
+    models.__path__ = []
+    sys.modules["models"] = models
+    for name in MODEL_MODULES:
+        module = _PlaceholderModule(f"models.{name}")
+        setattr(models, name, module)
+        sys.modules[module.__name__] = module
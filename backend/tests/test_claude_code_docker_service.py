@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from core.config import settings
+from services.claude_code_docker_service import DockerClaudeCodeSession, SHELL_READ_CHUNK
+
+
+@pytest.fixture
+def session():
+    return DockerClaudeCodeSession("agent-test", None)
+
+
+def read_framed(session, chunks, eof=True):
+    """Feed chunks to a stream and read one framed response from it"""
+    async def scenario():
+        stream = asyncio.StreamReader()
+        for chunk in chunks:
+            stream.feed_data(chunk)
+        if eof:
+            stream.feed_eof()
+        return await session._read_until_sentinel(stream)
+
+    return asyncio.run(scenario())
+
+
+def test_reads_output_and_exit_code(session):
+    output, marker, truncated = read_framed(session, [b"hello\n" + session._sentinel + b"3\n"])
+
+    assert output == b"hello"
+    assert marker == session._sentinel + b"3\n"
+    assert not truncated
+
+
+def test_empty_output(session):
+    output, marker, truncated = read_framed(session, [b"\n" + session._sentinel + b"0\n"])
+
+    assert output == b""
+    assert marker == session._sentinel + b"0\n"
+    assert not truncated
+
+
+def test_sentinel_split_across_chunks(session):
+    framed = b"partial output\n" + session._sentinel + b"12\n"
+    # Split inside the marker, then again between the exit code and its newline
+    split = framed.index(session._sentinel) + 5
+    chunks = [framed[:split], framed[split:-1], framed[-1:]]
+
+    output, marker, truncated = read_framed(session, chunks)
+
+    assert output == b"partial output"
+    assert marker == session._sentinel + b"12\n"
+    assert not truncated
+
+
+def test_sentinel_without_leading_newline_is_output(session):
+    framed = b"echoed " + session._sentinel + b"7\n" + b"\n" + session._sentinel + b"0\n"
+
+    output, marker, _ = read_framed(session, [framed])
+
+    assert output == b"echoed " + session._sentinel + b"7\n"
+    assert marker == session._sentinel + b"0\n"
+
+
+def test_oversized_line_keeps_capped_tail(session, monkeypatch):
+    cap = 4 * SHELL_READ_CHUNK
+    monkeypatch.setattr(settings, "CLAUDE_OUTPUT_CAP", cap)
+    # One line several times the cap, fed in read-sized chunks
+    line = bytes(range(256)) * (3 * cap // 256) + b"end of line"
+    framed = line + b"\n" + session._sentinel + b"1\n"
+    chunks = [framed[i:i + SHELL_READ_CHUNK] for i in range(0, len(framed), SHELL_READ_CHUNK)]
+
+    output, marker, truncated = read_framed(session, chunks)
+
+    assert truncated
+    assert output == line[-cap:]
+    assert marker == session._sentinel + b"1\n"
+
+
+def test_output_exactly_at_cap_is_not_truncated(session, monkeypatch):
+    monkeypatch.setattr(settings, "CLAUDE_OUTPUT_CAP", 64)
+    line = b"x" * 64
+
+    output, _, truncated = read_framed(session, [line + b"\n" + session._sentinel + b"0\n"])
+
+    assert output == line
+    assert not truncated
+
+
+def test_shell_exit_before_sentinel_raises(session):
+    with pytest.raises(RuntimeError):
+        read_framed(session, [b"no sentinel here"])
+
+
+def test_multibyte_output_over_cap_is_cut_at_a_character(session, monkeypatch):
+    cap = 65536
+    monkeypatch.setattr(settings, "CLAUDE_OUTPUT_CAP", cap)
+    # 3-byte characters, so a cut at the cap falls mid-character
+    text = "€" * 200000
+    framed = text.encode() + b"\n" + session._sentinel + b"0\n"
+    chunks = [framed[i:i + SHELL_READ_CHUNK] for i in range(0, len(framed), SHELL_READ_CHUNK)]
+
+    output, _, truncated = read_framed(session, chunks)
+
+    assert truncated
+    assert len(output) <= cap
+    assert output.decode() == "€" * (len(output) // 3)
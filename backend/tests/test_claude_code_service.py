@@ -0,0 +1,246 @@
+import asyncio
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+from core.config import settings
+from services import claude_code_service
+from services.claude_code_service import (
+    ClaudeCodeService,
+    ClaudeCodeSession,
+    ClaudeCommandError,
+    _encode_command,
+)
+
+
+def result_line(text, is_error=False):
+    event = {"type": "result", "subtype": "error" if is_error else "success", "is_error": is_error, "result": text}
+    return json.dumps(event).encode('utf-8') + b"\n"
+
+
+def run_reader(session, chunks, pending=1, eof=True):
+    """Feed stdout chunks through the session's reader and return its pending futures"""
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        responses = [loop.create_future() for _ in range(pending)]
+        session._pending.extend(responses)
+        stdout = asyncio.StreamReader()
+        reader = asyncio.create_task(session._read_responses(stdout))
+        for chunk in chunks:
+            stdout.feed_data(chunk)
+            await asyncio.sleep(0)
+        if eof:
+            stdout.feed_eof()
+        await reader
+        return responses
+
+    return asyncio.run(scenario())
+
+
+def outcome(response):
+    return response.exception() or response.result()
+
+
+@pytest.fixture
+def session(tmp_path):
+    return ClaudeCodeSession("agent-test", str(tmp_path))
+
+
+def test_encoded_command_is_one_json_line():
+    command = "print a line\n__DONE__0\nthen {\"type\": \"result\"}"
+    encoded = _encode_command(command)
+
+    assert encoded.endswith(b"\n")
+    assert encoded.count(b"\n") == 1
+    assert json.loads(encoded)["message"]["content"] == command
+
+
+def test_results_resolve_commands_in_order(session):
+    responses = run_reader(session, [result_line("first"), result_line("second")], pending=2)
+
+    assert [outcome(r) for r in responses] == ["first", "second"]
+
+
+def test_result_split_across_chunks(session):
+    line = result_line("split")
+    chunks = [line[:7], line[7:20], line[20:]]
+
+    responses = run_reader(session, chunks)
+
+    assert outcome(responses[0]) == "split"
+
+
+def test_output_echoing_a_marker_does_not_end_the_command(session):
+    assistant = {"type": "assistant", "message": {"content": [{"type": "text", "text": "__ARTAC_DONE__0\n"}]}}
+    chunks = [
+        b"warning: not json\n",
+        json.dumps(assistant).encode('utf-8') + b"\n",
+        b"\n",
+        result_line("done"),
+    ]
+
+    responses = run_reader(session, chunks, pending=2)
+
+    assert outcome(responses[0]) == "done"
+    # Output closed before a second result arrived
+    assert isinstance(outcome(responses[1]), RuntimeError)
+
+
+def test_error_result_fails_the_command(session):
+    responses = run_reader(session, [result_line("rate limited", is_error=True)])
+
+    error = outcome(responses[0])
+    assert isinstance(error, ClaudeCommandError)
+    assert str(error) == "rate limited"
+
+
+def test_result_with_nothing_pending_is_ignored(session):
+    responses = run_reader(session, [result_line("stray")], pending=0)
+
+    assert responses == []
+    assert not session._pending
+
+
+def test_timed_out_command_still_consumes_its_result(session):
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        timed_out, waiting = loop.create_future(), loop.create_future()
+        timed_out.cancel()
+        session._pending.extend([timed_out, waiting])
+        stdout = asyncio.StreamReader()
+        stdout.feed_data(result_line("late") + result_line("current"))
+        stdout.feed_eof()
+        await session._read_responses(stdout)
+        return waiting.result()
+
+    assert asyncio.run(scenario()) == "current"
+
+
+def test_pause_longer_than_stall_threshold_still_answers(session, monkeypatch):
+    monkeypatch.setattr(claude_code_service, "GAP_DEFAULT_STALL", 0.05)
+    session.is_active = True
+
+    async def scenario():
+        response = asyncio.get_running_loop().create_future()
+        session._pending.append(response)
+        stdout = asyncio.StreamReader()
+        reader = asyncio.create_task(session._read_responses(stdout))
+        stdout.feed_data(b'{"type": "system", "subtype": "init"}\n')
+        await asyncio.sleep(0.3)
+        stdout.feed_data(result_line("after a pause"))
+        stdout.feed_eof()
+        await reader
+        return response.result()
+
+    assert asyncio.run(scenario()) == "after a pause"
+    assert session.is_active
+
+
+def test_pause_after_learned_short_gaps_still_answers(session, monkeypatch):
+    monkeypatch.setattr(claude_code_service, "GAP_FLOOR", 0.01)
+    for _ in range(claude_code_service.GAP_MIN_SAMPLES):
+        session._gap_hist.add(0.002)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        responses = [loop.create_future(), loop.create_future()]
+        session._pending.extend(responses)
+        stdout = asyncio.StreamReader()
+        reader = asyncio.create_task(session._read_responses(stdout))
+        stdout.feed_data(b'{"type": "assistant"}\n')
+        await asyncio.sleep(0.2)
+        stdout.feed_data(result_line("first") + result_line("second"))
+        stdout.feed_eof()
+        await reader
+        return [outcome(r) for r in responses]
+
+    # Neither the slow command nor the one queued behind it is failed
+    assert asyncio.run(scenario()) == ["first", "second"]
+
+
+STAND_IN_CLI = """\
+import json, sys, time
+for line in sys.stdin:
+    print(json.dumps({"type": "system", "subtype": "init"}), flush=True)
+    time.sleep(float(sys.argv[-1]))
+    print(json.dumps({"type": "result", "is_error": False, "result": "thought it over"}), flush=True)
+"""
+
+
+def test_execute_command_waits_out_a_long_pause(tmp_path, monkeypatch):
+    # A stand-in CLI that goes quiet for longer than the stall threshold
+    cli = tmp_path / "claude"
+    cli.write_text(f"#!{sys.executable}\n" + STAND_IN_CLI)
+    cli.chmod(0o755)
+    monkeypatch.setattr(settings, "CLAUDE_CODE_PATH", str(cli))
+    monkeypatch.setattr(claude_code_service, "CLAUDE_STREAM_ARGS", ("0.5",))
+    monkeypatch.setattr(claude_code_service, "GAP_DEFAULT_STALL", 0.1)
+    workdir = tmp_path / "work"
+
+    async def scenario():
+        session = ClaudeCodeSession("agent-test", str(workdir))
+        try:
+            return await session.execute_command("think hard", timeout=30)
+        finally:
+            await session.close_session()
+
+    result = asyncio.run(scenario())
+
+    assert result["success"], result
+    assert result["stdout"] == "thought it over"
+
+
+def test_agent_session_directory_survives_close():
+    session = ClaudeCodeSession("agent-keep")
+    produced = os.path.join(session.working_directory, "report.md")
+    with open(produced, "w") as f:
+        f.write("agent output")
+
+    try:
+        asyncio.run(session.close_session())
+
+        assert os.path.basename(session.working_directory).startswith("artac-agent-agent-keep-")
+        assert os.path.exists(produced)
+    finally:
+        shutil.rmtree(session.working_directory, ignore_errors=True)
+
+
+def test_one_shot_scratch_directory_is_wiped_on_close():
+    session = ClaudeCodeSession("oneshot-test", pooled_directory=True)
+    scratch = os.path.join(session.working_directory, "scratch.txt")
+    with open(scratch, "w") as f:
+        f.write("throwaway")
+
+    asyncio.run(session.close_session())
+
+    assert not os.path.exists(scratch)
+
+
+def test_pooled_and_spawned_one_shots_return_the_same_shape(tmp_path, monkeypatch):
+    cli = tmp_path / "claude"
+    cli.write_text(f"#!{sys.executable}\n" + STAND_IN_CLI)
+    cli.chmod(0o755)
+    monkeypatch.setattr(settings, "CLAUDE_CODE_PATH", str(cli))
+    monkeypatch.setattr(claude_code_service, "CLAUDE_STREAM_ARGS", ("0",))
+
+    async def scenario():
+        service = ClaudeCodeService()
+        session = await service._start_oneshot_session()
+        process = session.process
+        pooled = await service._run_pooled_one_shot(session, "summarise", timeout=30)
+        spawned = await service._spawn_one_shot("summarise", timeout=30)
+        await service.shutdown()
+        return pooled, spawned, process.returncode
+
+    pooled, spawned, pooled_exit = asyncio.run(scenario())
+
+    assert pooled.keys() == spawned.keys()
+    for result in (pooled, spawned):
+        assert result["success"]
+        assert result["stdout"] == "thought it over"
+        assert result["return_code"] == 0
+    # The pooled session served its one command and was retired
+    assert pooled_exit == 0
@@ -0,0 +1,223 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from models.organizational_hierarchy import AuthorityLevel
+from services.collaborative_decision_system import (
+    CollaborativeDecision,
+    CollaborativeDecisionSystem,
+    DecisionOption,
+    DecisionStatus,
+    DecisionType,
+    VoteType,
+    _PHASE_EVALUATE,
+    _PHASE_VOTING,
+)
+
+
+def make_option(option_id):
+    return DecisionOption(
+        id=option_id,
+        title=option_id,
+        description="",
+        proposed_by="dev-001",
+        pros=[],
+        cons=[],
+        implementation_effort="medium",
+        risk_level="medium",
+        cost_estimate=None,
+        timeline_impact=None,
+        votes={},
+        vote_reasoning={}
+    )
+
+
+def make_decision(weights, minimum_consensus=0.7, options=("opt-a", "opt-b"), status=DecisionStatus.VOTING):
+    """Build a decision with one vote row per agent in weights, without touching other services"""
+    now = datetime.utcnow()
+    return CollaborativeDecision(
+        id="decision-test",
+        project_id="project-test",
+        decision_type=DecisionType.PROJECT_APPROACH,
+        title="Test decision",
+        description="",
+        context={},
+        options=[make_option(option_id) for option_id in options],
+        required_participants=list(weights),
+        optional_participants=[],
+        minimum_consensus=minimum_consensus,
+        authority_required=AuthorityLevel.INDIVIDUAL_CONTRIBUTOR,
+        initiated_by="dev-001",
+        facilitator=None,
+        status=status,
+        discussion_messages=[],
+        deadline=now + timedelta(hours=1),
+        created_at=now,
+        updated_at=now,
+        decision_made_at=None,
+        selected_option=None,
+        final_reasoning=None,
+        metadata={},
+        deadline_monotonic=time.monotonic() + 3600,
+        voter_rows={agent_id: i for i, agent_id in enumerate(weights)},
+        authority_weights=np.array(list(weights.values()), dtype=np.float32),
+        eligible_weight=sum(weights.values())
+    )
+
+
+def make_system(decision=None):
+    system = CollaborativeDecisionSystem(None, None)
+    if decision is not None:
+        system.active_decisions[decision.id] = decision
+    return system
+
+
+def test_vote_change_moves_weight_between_options():
+    decision = make_decision({"cto-001": 3.0, "dev-001": 1.0})
+    system = make_system(decision)
+
+    assert system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+    assert system._record_vote(decision, "cto-001", "opt-b", VoteType.APPROVE)
+
+    total_votes, cast_weight, approvals = system._tally_votes(decision)
+    assert total_votes == 1
+    assert cast_weight == 3.0
+    assert approvals.tolist() == [0.0, 3.0]
+    assert "cto-001" not in decision.options[0].votes
+    assert decision.options[1].votes["cto-001"] == VoteType.APPROVE
+
+
+def test_vote_change_to_reject_drops_approval_but_keeps_participation():
+    decision = make_decision({"cto-001": 3.0, "dev-001": 1.0})
+    system = make_system(decision)
+
+    system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+    system._record_vote(decision, "cto-001", "opt-a", VoteType.REJECT)
+
+    total_votes, cast_weight, approvals = system._tally_votes(decision)
+    assert total_votes == 1
+    assert cast_weight == 3.0
+    assert approvals.tolist() == [0.0, 0.0]
+
+
+def test_running_tallies_match_recount():
+    decision = make_decision({"cto-001": 3.0, "dev-001": 1.0, "dev-002": 1.0})
+    system = make_system(decision)
+
+    system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+    system._record_vote(decision, "dev-001", "opt-b", VoteType.APPROVE)
+    system._record_vote(decision, "dev-001", "opt-a", VoteType.APPROVE)
+    system._record_vote(decision, "dev-002", "opt-b", VoteType.ABSTAIN)
+    running = system._tally_votes(decision)
+    running = (running[0], running[1], running[2].copy())
+
+    system._recount_votes(decision)
+    recounted = system._tally_votes(decision)
+    assert recounted[0] == running[0]
+    assert recounted[1] == running[1]
+    assert recounted[2].tolist() == running[2].tolist()
+
+
+def test_votes_on_closed_or_unknown_options_are_refused():
+    decision = make_decision({"cto-001": 1.0})
+    system = make_system(decision)
+
+    assert not system._record_vote(decision, "cto-001", "opt-missing", VoteType.APPROVE)
+    decision.status = DecisionStatus.CONSENSUS_REACHED
+    assert not system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+    assert system._tally_votes(decision)[0] == 0
+
+
+def test_outcome_undecided_below_quorum():
+    decision = make_decision({"cto-001": 1.0, "dev-001": 1.0, "dev-002": 1.0, "qa-001": 1.0})
+    system = make_system(decision)
+
+    system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+    assert not system._outcome_decided(decision)
+
+
+def test_outcome_decided_once_outstanding_votes_cannot_overturn_leader():
+    decision = make_decision({"cto-001": 1.0, "dev-001": 1.0, "dev-002": 1.0, "qa-001": 1.0, "dev-003": 1.0},
+                             minimum_consensus=0.7)
+    system = make_system(decision)
+
+    for agent_id in ("cto-001", "dev-001", "dev-002", "qa-001"):
+        system._record_vote(decision, agent_id, "opt-a", VoteType.APPROVE)
+    # 4 of 5 already back opt-a, above 0.7 whatever the last voter does
+    assert system._outcome_decided(decision)
+
+
+def test_outcome_decided_once_no_option_can_reach_consensus():
+    decision = make_decision({"cto-001": 1.0, "dev-001": 1.0, "dev-002": 1.0, "qa-001": 1.0, "dev-003": 1.0},
+                             minimum_consensus=0.7)
+    system = make_system(decision)
+
+    system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+    system._record_vote(decision, "dev-001", "opt-b", VoteType.APPROVE)
+    system._record_vote(decision, "dev-002", "opt-a", VoteType.REJECT)
+    system._record_vote(decision, "qa-001", "opt-b", VoteType.REJECT)
+    # Even if the last voter backs the leader, 2 of 5 is short of 0.7
+    assert system._outcome_decided(decision)
+
+
+def test_outcome_undecided_while_outstanding_votes_can_still_swing_it():
+    decision = make_decision({"cto-001": 1.0, "dev-001": 1.0, "dev-002": 1.0, "qa-001": 1.0, "dev-003": 1.0},
+                             minimum_consensus=0.7)
+    system = make_system(decision)
+
+    for agent_id in ("cto-001", "dev-001", "dev-002"):
+        system._record_vote(decision, agent_id, "opt-a", VoteType.APPROVE)
+    system._record_vote(decision, "qa-001", "opt-a", VoteType.REJECT)
+    # 3 of 5 approve; the last vote decides whether opt-a reaches 0.7
+    assert not system._outcome_decided(decision)
+
+
+def test_unanimity_is_decided_on_the_first_dissent():
+    decision = make_decision({"cto-001": 1.0, "dev-001": 1.0, "dev-002": 1.0}, minimum_consensus=1.0)
+    system = make_system(decision)
+
+    system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+    assert not system._outcome_decided(decision)
+    system._record_vote(decision, "dev-001", "opt-a", VoteType.REJECT)
+    assert system._outcome_decided(decision)
+
+
+def test_unschedule_drops_only_that_decisions_phases():
+    system = make_system()
+
+    async def scenario():
+        now = time.monotonic()
+        system._schedule("decision-a", _PHASE_VOTING, now + 60)
+        system._schedule("decision-b", _PHASE_VOTING, now + 120)
+        system._schedule("decision-a", _PHASE_EVALUATE, now + 180)
+
+        system._unschedule("decision-a")
+        remaining = [decision_id for _, _, decision_id in system._deadline_heap]
+        await system.shutdown()
+        return remaining
+
+    assert asyncio.run(scenario()) == ["decision-b"]
+
+
+def test_terminal_outcome_unschedules_decision():
+    decision = make_decision({"cto-001": 1.0, "dev-001": 1.0, "dev-002": 1.0}, minimum_consensus=1.0)
+    system = make_system(decision)
+
+    async def hand_to_conflict_resolution(decision):
+        decision.status = DecisionStatus.CONFLICT_RESOLUTION
+
+    system._hand_to_conflict_resolution = hand_to_conflict_resolution
+
+    async def scenario():
+        system._schedule(decision.id, _PHASE_EVALUATE, decision.deadline_monotonic)
+        system._record_vote(decision, "cto-001", "opt-a", VoteType.APPROVE)
+        system._record_vote(decision, "dev-001", "opt-a", VoteType.REJECT)
+        await system._evaluate_consensus(decision)
+        remaining = list(system._deadline_heap)
+        await system.shutdown()
+        return remaining
+
+    assert asyncio.run(scenario()) == []
+    assert decision.status == DecisionStatus.CONFLICT_RESOLUTION